@@ -7,12 +7,336 @@ for identifying common logical fallacies in argumentative text.
 import json
 import logging
 import re
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Pattern, Tuple
+
+try:
+    import re2
+except ImportError:
+    # google-re2 is optional; the stdlib engine is used when it is missing
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    # hyperscan is optional; triggers are scanned with a regex when it is missing
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+# Texts longer than this bypass the result cache so that a few very large
+# inputs cannot hold on to cache memory.
+_MAX_CACHED_TEXT_LENGTH = 64_000
+
+
+def _compile_unbounded(pattern: str) -> Pattern[str]:
+    """Compile a case-insensitive pattern containing unbounded wildcards.
+
+    These patterns are matched with RE2 when google-re2 is installed, which
+    guarantees linear-time matching instead of backtracking over ``.+``.
+    """
+    if re2 is not None:
+        return re2.compile(f"(?i){pattern}")
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _keyword_alternation(*keywords: str) -> Pattern[str]:
+    """Compile whole-word keywords into a single case-insensitive alternation.
+
+    Word boundaries stop short keywords from matching inside longer words,
+    e.g. "all" inside "ball".
+    """
+    alternation = "|".join(re.escape(keyword) for keyword in keywords)
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
+def _phrase_alternation(*phrases: str) -> Pattern[str]:
+    """Compile literal phrases into a single case-insensitive alternation.
 
-def detect_fallacies(text: str) -> str:
+    The alternation is wrapped in a lookahead so overlapping phrases are each
+    reported by findall, matching the behavior of separate substring checks.
+    """
+    alternation = "|".join(re.escape(phrase) for phrase in phrases)
+    return re.compile(f"(?=({alternation}))", re.IGNORECASE)
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Return the lowercased words in text."""
+    return frozenset(word.lower() for word in _WORD_RE.findall(text))
+
+
+def _count_phrases(pattern: Pattern[str], text: str) -> int:
+    """Count the distinct phrases of an alternation pattern present in text."""
+    return len({match.lower() for match in pattern.findall(text)})
+
+
+def _dumps(result: Dict[str, Any], pretty: bool) -> str:
+    """Serialize a tool result, compact unless pretty output is requested."""
+    if pretty:
+        return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
+# Regex patterns are compiled once at import time with re.IGNORECASE so that
+# each call to detect_fallacies only pays for matching against the original
+# text, without pattern cache lookups or a lowercased copy of the input.
+# Checks that only need to know whether any pattern matches use a single
+# factored alternation; checks that score each pattern keep a tuple.
+# Patterns with unbounded ``.+`` wildcards go through _compile_unbounded.
+_AD_HOMINEM_RE = re.compile(
+    r"(?:you(?:'re| are)|(?:he|she|they) (?:is|are|'s)) "
+    r"(?:stupid|dumb|ignorant|naive|biased|wrong|crazy)"
+    r"|that's (?:stupid|dumb|ignorant|ridiculous)"
+    r"|you (?:clearly|obviously) don't understand",
+    re.IGNORECASE
+)
+
+_FALSE_DICHOTOMY_RE = _compile_unbounded(
+    r"(?:either|you must) .+ or .+"
+    r"|only two|two (?:choices|options)"
+    r"|(?:if not|unless) .+, then"
+)
+
+# A single character either side is equivalent to ".+ always .+" for a
+# search, without the backtracking over leading and trailing wildcards.
+_HASTY_GENERALIZATION_PATTERNS = tuple(_compile_unbounded(p) for p in (
+    "all .+ are",
+    "every .+ is",
+    "no .+ ever",
+    ". always .",
+    ". never ."
+))
+
+_APPEAL_TO_AUTHORITY_RE = _compile_unbounded(
+    r"(?:expert|authority|scientist|doctor|professor) says?"
+    r"|according to (?:experts|authorities|scientists|doctors)"
+    r"|(?:famous|well-known|respected) .+ (?:says|believes|thinks)"
+    r"|(?:celebrity|actor|politician) .+ (?:endorses|supports|says)"
+)
+
+_SLIPPERY_SLOPE_RE = _compile_unbounded(
+    r"if .+ then .+ will .+ and then"
+    r"|this will lead to .+ which will lead to"
+    r"|this is just the (?:beginning|start|first step)"
+)
+
+_CIRCULAR_REASONING_RE = re.compile(
+    r"because (?:(?:it is|they are|that's) (?:true|right|correct|the way it is)|i said so)"
+    r"|(?:the bible|god|tradition) says so"
+    r"|that's just how (?:it is|things are|the world works)"
+    r"|it's (?:true|right) because it's (?:true|right)",
+    re.IGNORECASE
+)
+
+_BANDWAGON_RE = re.compile(
+    r"everyone (?:(?:else )?(?:is doing|does|believes|thinks)|knows)"
+    r"|(?:majority of|most) people"
+    r"|(?:popular|common) opinion"
+    r"|it's (?:popular|trendy|fashionable|cool)"
+    r"|don't be (?:left out|different)",
+    re.IGNORECASE
+)
+
+_APPEAL_TO_EMOTION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    "people will (?:die|suffer)",
+    "innocent (?:people|children|victims)",
+    "you should be (?:ashamed|angry|outraged|scared)"
+))
+
+# Plain literal phrases need no regex machinery of their own: they are found
+# by the single _ANY_TRIGGER_RE scan below and checked by set membership.
+_AD_HOMINEM_PHRASES = frozenset({"shut up", "you don't know", "idiot", "moron", "fool"})
+
+_STRAW_MAN_INDICATORS = frozenset({
+    "so you're saying",
+    "what you really mean is",
+    "in other words",
+    "you think that",
+    "your position is basically"
+})
+
+_SLIPPERY_SLOPE_PHRASES = frozenset({
+    "next thing you know",
+    "before you know it",
+    "where will it end"
+})
+
+_DISTRACTION_PHRASES = frozenset({
+    "but what about",
+    "speaking of",
+    "that reminds me",
+    "by the way",
+    "off topic but",
+    "not to change the subject but"
+})
+
+_TOPIC_SHIFTS = frozenset({
+    "anyway", "meanwhile", "on another note", "while we're at it",
+    "that's another issue", "different topic"
+})
+
+_BANDWAGON_PHRASES = frozenset({"join the crowd"})
+
+_EMOTIONAL_APPEAL_PHRASES = frozenset({"think of the children", "for your family"})
+
+# Single keywords are checked against the set of words in the text, which is
+# built once per call; keyword phrases keep a word-boundary alternation.
+_WORD_RE = re.compile(r"\w+")
+
+_MISREPRESENTATION_WORDS = frozenset({
+    "extreme", "radical", "absurd", "ridiculous", "completely",
+    "totally", "absolutely", "never", "always", "everyone"
+})
+_MISREPRESENTATION_PHRASES = _keyword_alternation("no one")
+
+_ABSOLUTE_WORDS = frozenset({"only", "must"})
+_ABSOLUTE_PHRASES = _keyword_alternation("have to", "no choice", "no alternative")
+
+_GENERALIZATION_WORDS = frozenset({
+    "all", "every", "everyone", "nobody", "never",
+    "always", "everything", "nothing", "everywhere", "nowhere"
+})
+_GENERALIZATION_PHRASES = _keyword_alternation("no one")
+
+_EVIDENCE_WORDS = frozenset({
+    "statistics", "most", "many", "some", "typically", "generally", "usually", "often"
+})
+_EVIDENCE_PHRASES = _keyword_alternation("studies show", "research indicates", "data suggests")
+
+_WEAK_AUTHORITY_WORDS = frozenset({"celebrity", "actor", "politician"})
+_WEAK_AUTHORITY_PHRASES = _keyword_alternation(
+    "famous person", "my friend", "someone told me", "i heard"
+)
+
+_CHAIN_WORDS = frozenset({"then", "causing"})
+_CHAIN_PHRASES = _keyword_alternation("which will", "leading to", "resulting in")
+
+_EMOTIONAL_WORDS = frozenset({
+    "terrible", "horrible", "awful", "disgusting", "outrageous",
+    "wonderful", "amazing", "fantastic", "incredible", "devastating",
+    "heartbreaking", "tragic", "shocking", "appalling"
+})
+
+# Cheap literal triggers for each check: a check can only fire when at least
+# one of its triggers occurs in the text. All triggers, including the literal
+# phrases above, are scanned in a single pass by _ANY_TRIGGER_RE so that checks
+# with no triggers present are skipped.
+# No trigger may be a prefix of another, otherwise the lookahead scan would
+# only report the first alternative matching at a position.
+_AD_HOMINEM_TRIGGERS = _AD_HOMINEM_PHRASES | frozenset({
+    "stupid", "dumb", "ignorant", "naive", "biased", "wrong", "crazy",
+    "ridiculous", "don't understand"
+})
+
+_STRAW_MAN_TRIGGERS = _STRAW_MAN_INDICATORS | frozenset({
+    "extreme", "radical", "absurd", "ridiculous", "completely", "totally",
+    "absolutely", "never", "always", "ever", "no one"
+})
+
+_FALSE_DICHOTOMY_TRIGGERS = frozenset({"either", "must", "two", "if not", "unless"})
+
+_HASTY_GENERALIZATION_TRIGGERS = frozenset({
+    "all", "ever", "nobody", "no one", "never", "always", "nothing", "nowhere"
+})
+
+_APPEAL_TO_AUTHORITY_TRIGGERS = frozenset({
+    "say", "according to", "famous", "well-known", "respected",
+    "celebrity", "actor", "politician"
+})
+
+_SLIPPERY_SLOPE_TRIGGERS = _SLIPPERY_SLOPE_PHRASES | frozenset({"and then", "lead to", "just the"})
+
+_CIRCULAR_REASONING_TRIGGERS = frozenset({"because", "bible", "god", "tradition", "just how"})
+
+_RED_HERRING_TRIGGERS = _DISTRACTION_PHRASES | _TOPIC_SHIFTS
+
+_BANDWAGON_TRIGGERS = _BANDWAGON_PHRASES | frozenset({
+    "ever", "people", "opinion", "popular", "trendy", "fashionable", "cool",
+    "don't be"
+})
+
+_APPEAL_TO_EMOTION_TRIGGERS = _EMOTIONAL_APPEAL_PHRASES | frozenset({
+    "terrible", "horrible", "awful", "disgusting", "outrageous", "wonderful",
+    "amazing", "fantastic", "incredible", "devastating", "heartbreaking",
+    "tragic", "shocking", "appalling", "people", "innocent", "should be"
+})
+
+_ALL_TRIGGERS = tuple(sorted(
+    _AD_HOMINEM_TRIGGERS
+    | _STRAW_MAN_TRIGGERS
+    | _FALSE_DICHOTOMY_TRIGGERS
+    | _HASTY_GENERALIZATION_TRIGGERS
+    | _APPEAL_TO_AUTHORITY_TRIGGERS
+    | _SLIPPERY_SLOPE_TRIGGERS
+    | _CIRCULAR_REASONING_TRIGGERS
+    | _RED_HERRING_TRIGGERS
+    | _BANDWAGON_TRIGGERS
+    | _APPEAL_TO_EMOTION_TRIGGERS
+))
+
+_ANY_TRIGGER_RE = _phrase_alternation(*_ALL_TRIGGERS)
+
+
+def _compile_trigger_database() -> Any:
+    """Compile all triggers into a Hyperscan database, if hyperscan is installed.
+
+    Hyperscan matches every trigger in a single SIMD scan of the text and
+    reports overlapping triggers natively, so it replaces _ANY_TRIGGER_RE.
+    """
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(trigger).encode("utf-8") for trigger in _ALL_TRIGGERS],
+        ids=list(range(len(_ALL_TRIGGERS))),
+        elements=len(_ALL_TRIGGERS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_ALL_TRIGGERS)
+    )
+    return database
+
+
+_TRIGGER_DATABASE = _compile_trigger_database()
+
+_SUGGESTION_MAP = {
+    "ad_hominem": "Focus on addressing the argument itself rather than attacking the person making it",
+    "straw_man": "Represent opposing viewpoints accurately and address their strongest form",
+    "false_dichotomy": "Consider additional alternatives and middle-ground positions",
+    "hasty_generalization": "Provide more evidence and use qualifying language (e.g., 'many', 'some', 'often')",
+    "appeal_to_authority": "Cite relevant experts and provide supporting evidence beyond authority",
+    "slippery_slope": "Provide evidence for each step in your chain of reasoning",
+    "circular_reasoning": "Ensure your premises provide independent support for your conclusion",
+    "red_herring": "Stay focused on the main topic and address relevant points directly",
+    "bandwagon": "Base your argument on evidence and merit rather than popularity",
+    "appeal_to_emotion": "Balance emotional content with logical reasoning and factual evidence"
+}
+
+# Compact result for empty or whitespace-only text, returned without building
+# a result dict; whitespace-only text is spliced into the first field.
+_EMPTY_TEXT_FIELD = '"text_analyzed":""'
+_EMPTY_RESULT_JSON = _dumps({
+    "text_analyzed": "",
+    "fallacies_detected": [],
+    "analysis": "No text provided for analysis.",
+    "confidence": 0.0,
+    "suggestions": ["Provide argumentative text to analyze for logical fallacies."]
+}, pretty=False)
+
+
+def _find_triggers(text: str) -> FrozenSet[str]:
+    """Return the lowercased fallacy triggers present in text."""
+    if _TRIGGER_DATABASE is None:
+        return frozenset(match.lower() for match in _ANY_TRIGGER_RE.findall(text))
+
+    found: List[str] = []
+
+    def on_match(trigger_id: int, *_: Any) -> None:
+        found.append(_ALL_TRIGGERS[trigger_id])
+
+    _TRIGGER_DATABASE.scan(text.encode("utf-8", "surrogatepass"), match_event_handler=on_match)
+    return frozenset(found)
+
+
+def detect_fallacies(text: str, pretty: bool = False, max_detect: int = 10) -> str:
     """
     Identify logical fallacies in argumentative text.
 
@@ -22,6 +346,10 @@ def detect_fallacies(text: str) -> str:
 
     Args:
         text: Text containing argument to analyze for fallacies
+        pretty: Indent the returned JSON for human readers instead of
+            returning compact JSON
+        max_detect: Stop checking once this many fallacies have been
+            detected; must be at least 1, and the default runs every check
 
     Returns:
         JSON string containing detailed fallacy analysis including:
@@ -30,7 +358,34 @@ def detect_fallacies(text: str) -> str:
         - confidence: confidence score (0.0 to 1.0) for detection accuracy
         - suggestions: recommendations for improving the argument
         - text_analyzed: the original text that was analyzed
+
+    Raises:
+        ValueError: If max_detect is less than 1
     """
+    if max_detect < 1:
+        raise ValueError(f"max_detect must be at least 1, got {max_detect}")
+    if not isinstance(text, str):
+        # Arguments come from the model and may be of any JSON type; those
+        # bypass the cache so the analysis reports them as an error result
+        return _dumps(_detect_fallacies_impl(text, max_detect), pretty)
+    if not pretty and not text.strip():
+        if not text:
+            return _EMPTY_RESULT_JSON
+        text_field = f'"text_analyzed":{json.dumps(text, ensure_ascii=False)}'
+        return _EMPTY_RESULT_JSON.replace(_EMPTY_TEXT_FIELD, text_field, 1)
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return _detect_fallacies_cached.__wrapped__(text, pretty, max_detect)
+    return _detect_fallacies_cached(text, pretty, max_detect)
+
+
+@lru_cache(maxsize=512)
+def _detect_fallacies_cached(text: str, pretty: bool, max_detect: int) -> str:
+    """Analyze text for fallacies, memoizing results for repeated tool calls."""
+    return _dumps(_detect_fallacies_impl(text, max_detect), pretty)
+
+
+def _detect_fallacies_impl(text: str, max_detect: int = 10) -> Dict[str, Any]:
+    """Analyze text for fallacies and return the result as a dict."""
     try:
         analysis_result: Dict[str, Any] = {
             "text_analyzed": text,
@@ -43,53 +398,51 @@ def detect_fallacies(text: str) -> str:
         if not text or not text.strip():
             analysis_result["analysis"] = "No text provided for analysis."
             analysis_result["suggestions"].append("Provide argumentative text to analyze for logical fallacies.")
-            return json.dumps(analysis_result, indent=2)
+            return analysis_result
+
+        ranked_fallacies: List[Tuple[int, Dict[str, Any]]] = []
 
-        text_lower = text.lower()
-        fallacies_found: List[Dict[str, Any]] = []
-        confidence_scores: List[float] = []
+        # Scan for every check's triggers in one pass before running checks
+        triggers_found = _find_triggers(text)
+        tokens = _tokenize(text)
 
         # Check for each type of fallacy
-        fallacy_checks = [
-            _check_ad_hominem,
-            _check_straw_man,
-            _check_false_dichotomy,
-            _check_hasty_generalization,
-            _check_appeal_to_authority,
-            _check_slippery_slope,
-            _check_circular_reasoning,
-            _check_red_herring,
-            _check_bandwagon,
-            _check_appeal_to_emotion
-        ]
-
-        for check_function in fallacy_checks:
-            detected, confidence, description = check_function(text, text_lower)
+        for report_position, check_function, triggers in _FALLACY_CHECKS:
+            if triggers_found.isdisjoint(triggers):
+                continue
+            detected, confidence, description = check_function(text, triggers_found, tokens)
             if detected:
-                fallacies_found.append({
+                ranked_fallacies.append((report_position, {
                     "type": detected,
                     "confidence": confidence,
                     "description": description
-                })
-                confidence_scores.append(confidence)
+                }))
+                if len(ranked_fallacies) >= max_detect:
+                    break
+
+        # Report fallacies in their declared order, not the evaluation order
+        ranked_fallacies.sort(key=lambda ranked: ranked[0])
+        fallacies_found = [fallacy for _, fallacy in ranked_fallacies]
+        confidence_scores = [fallacy["confidence"] for fallacy in fallacies_found]
 
         # Populate results
         analysis_result["fallacies_detected"] = [f["type"] for f in fallacies_found]
 
         if fallacies_found:
+            fallacy_count = len(fallacies_found)
+
             # Calculate overall confidence as average of individual confidences
-            analysis_result["confidence"] = sum(confidence_scores) / len(confidence_scores)
+            analysis_result["confidence"] = sum(confidence_scores) / fallacy_count
 
             # Build detailed analysis
-            fallacy_descriptions = [f["description"] for f in fallacies_found]
+            suffix = "y" if fallacy_count == 1 else "ies"
+            descriptions = ", ".join(f["description"] for f in fallacies_found)
             analysis_result["analysis"] = (
-                f"Analysis identified {len(fallacies_found)} logical fallac"
-                f"{'y' if len(fallacies_found) == 1 else 'ies'}: "
-                f"{', '.join(fallacy_descriptions)}"
+                f"Analysis identified {fallacy_count} logical fallac{suffix}: {descriptions}"
             )
 
             # Generate suggestions based on detected fallacies
-            analysis_result["suggestions"] = _generate_suggestions(fallacies_found)
+            analysis_result["suggestions"] = _generate_suggestions(analysis_result["fallacies_detected"])
         else:
             analysis_result["analysis"] = (
                 "No obvious logical fallacies detected in the provided text. "
@@ -103,7 +456,7 @@ def detect_fallacies(text: str) -> str:
                 "Verify that your conclusion logically follows from your premises"
             ]
 
-        return json.dumps(analysis_result, indent=2)
+        return analysis_result
 
     except Exception as e:
         logger.error("Error in detect_fallacies: %s", e)
@@ -115,54 +468,33 @@ def detect_fallacies(text: str) -> str:
             "suggestions": ["Please try again with different text"],
             "error": "analysis_error"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
-def _check_ad_hominem(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_ad_hominem(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for ad hominem attacks."""
-    ad_hominem_patterns = [
-        r"you(?:'re| are) (?:stupid|dumb|ignorant|naive|biased|wrong|crazy)",
-        r"(?:he|she|they) (?:is|are|'s) (?:stupid|dumb|ignorant|naive|biased|wrong|crazy)",
-        r"that's (?:stupid|dumb|ignorant|ridiculous)",
-        r"(?:shut up|you don't know)",
-        r"(?:idiot|moron|fool)",
-        r"you (?:clearly|obviously) don't understand"
-    ]
-
-    for pattern in ad_hominem_patterns:
-        if re.search(pattern, text_lower):
-            return (
-                "ad_hominem",
-                0.85,
-                "Contains personal attacks rather than addressing the argument itself"
-            )
+    if (not triggers_found.isdisjoint(_AD_HOMINEM_PHRASES)
+            or _AD_HOMINEM_RE.search(text)):
+        return (
+            "ad_hominem",
+            0.85,
+            "Contains personal attacks rather than addressing the argument itself"
+        )
 
     return "", 0.0, ""
 
 
-def _check_straw_man(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_straw_man(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for straw man fallacy."""
-    straw_man_indicators = [
-        "so you're saying",
-        "what you really mean is",
-        "in other words",
-        "you think that",
-        "your position is basically"
-    ]
-
-    misrepresentation_words = [
-        "extreme", "radical", "absurd", "ridiculous", "completely",
-        "totally", "absolutely", "never", "always", "everyone", "no one"
-    ]
-
-    straw_man_score = 0.0
-    for indicator in straw_man_indicators:
-        if indicator in text_lower:
-            straw_man_score += 0.3
-
-    for word in misrepresentation_words:
-        if word in text_lower:
-            straw_man_score += 0.1
+    straw_man_score = 0.3 * len(triggers_found & _STRAW_MAN_INDICATORS)
+    straw_man_score += 0.1 * (
+        len(tokens & _MISREPRESENTATION_WORDS)
+        + _count_phrases(_MISREPRESENTATION_PHRASES, text)
+    )
 
     if straw_man_score >= 0.4:
         return (
@@ -174,64 +506,42 @@ def _check_straw_man(text: str, text_lower: str) -> Tuple[str, float, str]:
     return "", 0.0, ""
 
 
-def _check_false_dichotomy(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_false_dichotomy(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for false dichotomy/false dilemma."""
-    dichotomy_patterns = [
-        r"(?:either|you (?:either|must)) .+ or .+",
-        r"(?:only two|two choices|two options)",
-        r"(?:you're either|it's either) .+ or .+",
-        r"(?:if not .+, then|unless .+, then)"
-    ]
-
-    absolute_words = ["only", "must", "have to", "no choice", "no alternative"]
-
-    for pattern in dichotomy_patterns:
-        if re.search(pattern, text_lower):
-            # Check for absolute language to increase confidence
-            confidence = 0.7
-            if any(word in text_lower for word in absolute_words):
-                confidence = 0.85
-            return (
-                "false_dichotomy",
-                confidence,
-                "Presents only two options when more alternatives may exist"
-            )
+    if _FALSE_DICHOTOMY_RE.search(text):
+        # Check for absolute language to increase confidence
+        confidence = 0.7
+        if not tokens.isdisjoint(_ABSOLUTE_WORDS) or _ABSOLUTE_PHRASES.search(text):
+            confidence = 0.85
+        return (
+            "false_dichotomy",
+            confidence,
+            "Presents only two options when more alternatives may exist"
+        )
 
     return "", 0.0, ""
 
 
-def _check_hasty_generalization(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_hasty_generalization(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for hasty generalization."""
-    generalization_words = [
-        "all", "every", "everyone", "nobody", "no one", "never",
-        "always", "everything", "nothing", "everywhere", "nowhere"
-    ]
+    generalization_count = (
+        len(tokens & _GENERALIZATION_WORDS)
+        + _count_phrases(_GENERALIZATION_PHRASES, text)
+    )
 
     # Look for sweeping statements
-    hasty_indicators = [
-        "all .+ are",
-        "every .+ is",
-        "no .+ ever",
-        ".+ always .+",
-        ".+ never .+"
-    ]
-
-    confidence = 0.0
-    for word in generalization_words:
-        if word in text_lower:
-            confidence += 0.2
-
-    for pattern in hasty_indicators:
-        if re.search(pattern, text_lower):
-            confidence += 0.4
+    sweeping_count = sum(1 for pattern in _HASTY_GENERALIZATION_PATTERNS if pattern.search(text))
+    confidence = 0.2 * generalization_count + 0.4 * sweeping_count
 
     # Check if there's evidence or qualifying language
-    evidence_words = [
-        "studies show", "research indicates", "data suggests", "statistics",
-        "most", "many", "some", "typically", "generally", "usually", "often"
-    ]
-
-    has_evidence = any(word in text_lower for word in evidence_words)
+    has_evidence = (
+        not tokens.isdisjoint(_EVIDENCE_WORDS)
+        or _EVIDENCE_PHRASES.search(text) is not None
+    )
 
     if confidence >= 0.6 and not has_evidence:
         return (
@@ -243,107 +553,65 @@ def _check_hasty_generalization(text: str, text_lower: str) -> Tuple[str, float,
     return "", 0.0, ""
 
 
-def _check_appeal_to_authority(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_appeal_to_authority(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for inappropriate appeal to authority."""
-    authority_patterns = [
-        r"(?:expert|authority|scientist|doctor|professor) says?",
-        r"according to (?:experts|authorities|scientists|doctors)",
-        r"(?:famous|well-known|respected) .+ (?:says|believes|thinks)",
-        r"(?:celebrity|actor|politician) .+ (?:endorses|supports|says)"
-    ]
-
-    weak_authority_indicators = [
-        "celebrity", "actor", "politician", "famous person",
-        "my friend", "someone told me", "i heard"
-    ]
-
-    for pattern in authority_patterns:
-        if re.search(pattern, text_lower):
-            confidence = 0.6
-            # Higher confidence if it's clearly a weak authority
-            if any(indicator in text_lower for indicator in weak_authority_indicators):
-                confidence = 0.85
-            return (
-                "appeal_to_authority",
-                confidence,
-                "Relies on authority rather than evidence, or cites inappropriate authority"
-            )
+    if _APPEAL_TO_AUTHORITY_RE.search(text):
+        confidence = 0.6
+        # Higher confidence if it's clearly a weak authority
+        if (not tokens.isdisjoint(_WEAK_AUTHORITY_WORDS)
+                or _WEAK_AUTHORITY_PHRASES.search(text)):
+            confidence = 0.85
+        return (
+            "appeal_to_authority",
+            confidence,
+            "Relies on authority rather than evidence, or cites inappropriate authority"
+        )
 
     return "", 0.0, ""
 
 
-def _check_slippery_slope(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_slippery_slope(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for slippery slope fallacy."""
-    slope_patterns = [
-        r"if .+ then .+ will .+ and then",
-        r"this will lead to .+ which will lead to",
-        r"next thing you know",
-        r"before you know it",
-        r"this is just the (?:beginning|start|first step)",
-        r"where will it end"
-    ]
-
-    chain_indicators = ["then", "which will", "leading to", "resulting in", "causing"]
-
-    for pattern in slope_patterns:
-        if re.search(pattern, text_lower):
-            # Check for chain of consequences
-            chain_count = sum(1 for indicator in chain_indicators if indicator in text_lower)
-            confidence = 0.7 + min(chain_count * 0.1, 0.2)
-            return (
-                "slippery_slope",
-                confidence,
-                "Argues that one event will lead to a chain of negative consequences without evidence"
-            )
+    if (not triggers_found.isdisjoint(_SLIPPERY_SLOPE_PHRASES)
+            or _SLIPPERY_SLOPE_RE.search(text)):
+        # Check for chain of consequences
+        chain_count = len(tokens & _CHAIN_WORDS) + _count_phrases(_CHAIN_PHRASES, text)
+        confidence = 0.7 + min(chain_count * 0.1, 0.2)
+        return (
+            "slippery_slope",
+            confidence,
+            "Argues that one event will lead to a chain of negative consequences without evidence"
+        )
 
     return "", 0.0, ""
 
 
-def _check_circular_reasoning(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_circular_reasoning(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for circular reasoning."""
-    circular_patterns = [
-        r"because (?:it is|they are|that's) (?:true|right|correct|the way it is)",
-        r"(?:the bible|god|tradition) says so",
-        r"that's just how (?:it is|things are|the world works)",
-        r"because i said so",
-        r"it's (?:true|right) because it's (?:true|right)"
-    ]
-
-    for pattern in circular_patterns:
-        if re.search(pattern, text_lower):
-            return (
-                "circular_reasoning",
-                0.8,
-                "The reasoning is circular - the conclusion is used to support the premise"
-            )
+    if _CIRCULAR_REASONING_RE.search(text):
+        return (
+            "circular_reasoning",
+            0.8,
+            "The reasoning is circular - the conclusion is used to support the premise"
+        )
 
     return "", 0.0, ""
 
 
-def _check_red_herring(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_red_herring(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for red herring fallacy."""
-    distraction_phrases = [
-        "but what about",
-        "speaking of",
-        "that reminds me",
-        "by the way",
-        "off topic but",
-        "not to change the subject but"
-    ]
-
-    topic_shifts = [
-        "anyway", "meanwhile", "on another note", "while we're at it",
-        "that's another issue", "different topic"
-    ]
-
-    distraction_score = 0.0
-    for phrase in distraction_phrases:
-        if phrase in text_lower:
-            distraction_score += 0.4
-
-    for phrase in topic_shifts:
-        if phrase in text_lower:
-            distraction_score += 0.2
+    distraction_score = (
+        0.4 * len(triggers_found & _DISTRACTION_PHRASES)
+        + 0.2 * len(triggers_found & _TOPIC_SHIFTS)
+    )
 
     if distraction_score >= 0.5:
         return (
@@ -355,54 +623,29 @@ def _check_red_herring(text: str, text_lower: str) -> Tuple[str, float, str]:
     return "", 0.0, ""
 
 
-def _check_bandwagon(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_bandwagon(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for bandwagon/appeal to popularity fallacy."""
-    bandwagon_patterns = [
-        r"everyone (?:else |)(?:is doing|does|believes|thinks)",
-        r"most people (?:believe|think|do|say)",
-        r"(?:popular|common) opinion",
-        r"(?:majority of|most) people",
-        r"everyone knows",
-        r"it's (?:popular|trendy|fashionable|cool)",
-        r"join the crowd",
-        r"don't be (?:left out|different)"
-    ]
-
-    for pattern in bandwagon_patterns:
-        if re.search(pattern, text_lower):
-            return (
-                "bandwagon",
-                0.8,
-                "Appeals to popularity or what most people do/believe rather than evidence"
-            )
+    if (not triggers_found.isdisjoint(_BANDWAGON_PHRASES)
+            or _BANDWAGON_RE.search(text)):
+        return (
+            "bandwagon",
+            0.8,
+            "Appeals to popularity or what most people do/believe rather than evidence"
+        )
 
     return "", 0.0, ""
 
 
-def _check_appeal_to_emotion(text: str, text_lower: str) -> Tuple[str, float, str]:
+def _check_appeal_to_emotion(
+    text: str, triggers_found: FrozenSet[str], tokens: FrozenSet[str]
+) -> Tuple[str, float, str]:
     """Check for appeal to emotion fallacy."""
-    emotional_words = [
-        "terrible", "horrible", "awful", "disgusting", "outrageous",
-        "wonderful", "amazing", "fantastic", "incredible", "devastating",
-        "heartbreaking", "tragic", "shocking", "appalling"
-    ]
-
-    emotional_appeals = [
-        "think of the children",
-        "for your family",
-        "people will (?:die|suffer)",
-        "innocent (?:people|children|victims)",
-        "you should be (?:ashamed|angry|outraged|scared)"
-    ]
-
-    emotion_score = 0.0
-    for word in emotional_words:
-        if word in text_lower:
-            emotion_score += 0.2
-
-    for pattern in emotional_appeals:
-        if re.search(pattern, text_lower):
-            emotion_score += 0.4
+    word_count = len(tokens & _EMOTIONAL_WORDS)
+    appeal_count = len(triggers_found & _EMOTIONAL_APPEAL_PHRASES)
+    appeal_count += sum(1 for pattern in _APPEAL_TO_EMOTION_PATTERNS if pattern.search(text))
+    emotion_score = 0.2 * word_count + 0.4 * appeal_count
 
     if emotion_score >= 0.6:
         return (
@@ -414,30 +657,34 @@ def _check_appeal_to_emotion(text: str, text_lower: str) -> Tuple[str, float, st
     return "", 0.0, ""
 
 
-def _generate_suggestions(fallacies_found: List[Dict[str, Any]]) -> List[str]:
-    """Generate improvement suggestions based on detected fallacies."""
-    suggestions: List[str] = []
-    fallacy_types = [f["type"] for f in fallacies_found]
-
-    suggestion_map = {
-        "ad_hominem": "Focus on addressing the argument itself rather than attacking the person making it",
-        "straw_man": "Represent opposing viewpoints accurately and address their strongest form",
-        "false_dichotomy": "Consider additional alternatives and middle-ground positions",
-        "hasty_generalization": "Provide more evidence and use qualifying language (e.g., 'many', 'some', 'often')",
-        "appeal_to_authority": "Cite relevant experts and provide supporting evidence beyond authority",
-        "slippery_slope": "Provide evidence for each step in your chain of reasoning",
-        "circular_reasoning": "Ensure your premises provide independent support for your conclusion",
-        "red_herring": "Stay focused on the main topic and address relevant points directly",
-        "bandwagon": "Base your argument on evidence and merit rather than popularity",
-        "appeal_to_emotion": "Balance emotional content with logical reasoning and factual evidence"
-    }
-
-    for fallacy_type in fallacy_types:
-        if fallacy_type in suggestion_map:
-            suggestions.append(suggestion_map[fallacy_type])
+# Every check with the triggers that gate it and its position in the reported
+# fallacies list. Checks run broadest triggers first so that a max_detect limit
+# is reached with as few checks as possible, while results keep the order in
+# which the fallacies have always been reported.
+_FALLACY_CHECKS = (
+    (3, _check_hasty_generalization, _HASTY_GENERALIZATION_TRIGGERS),
+    (0, _check_ad_hominem, _AD_HOMINEM_TRIGGERS),
+    (1, _check_straw_man, _STRAW_MAN_TRIGGERS),
+    (9, _check_appeal_to_emotion, _APPEAL_TO_EMOTION_TRIGGERS),
+    (8, _check_bandwagon, _BANDWAGON_TRIGGERS),
+    (2, _check_false_dichotomy, _FALSE_DICHOTOMY_TRIGGERS),
+    (6, _check_circular_reasoning, _CIRCULAR_REASONING_TRIGGERS),
+    (4, _check_appeal_to_authority, _APPEAL_TO_AUTHORITY_TRIGGERS),
+    (5, _check_slippery_slope, _SLIPPERY_SLOPE_TRIGGERS),
+    (7, _check_red_herring, _RED_HERRING_TRIGGERS)
+)
+
+
+def _generate_suggestions(fallacy_types: List[str]) -> List[str]:
+    """Generate improvement suggestions based on detected fallacy types."""
+    suggestions = [
+        _SUGGESTION_MAP[fallacy_type]
+        for fallacy_type in dict.fromkeys(fallacy_types)
+        if fallacy_type in _SUGGESTION_MAP
+    ]
 
     # Add general suggestions
-    if len(fallacies_found) > 1:
+    if len(fallacy_types) > 1:
         suggestions.append("Review your argument structure to ensure logical consistency throughout")
 
     suggestions.append("Consider potential counterarguments and address them proactively")
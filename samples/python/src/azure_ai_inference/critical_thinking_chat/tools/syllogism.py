@@ -5,11 +5,64 @@ This module provides the evaluate_syllogism function and supporting helpers.
 """
 import json
 import logging
+import re
+from functools import lru_cache
 from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
-def evaluate_syllogism(major_premise: str, minor_premise: str, conclusion: str) -> str:
+# Syllogisms longer than this in total bypass the result cache so that a few
+# very large inputs cannot hold on to cache memory.
+_MAX_CACHED_TEXT_LENGTH = 64_000
+
+# Keyword classes found in the major premise, recorded as bits so that every
+# classification branch is an integer test after a single regex scan.
+_CONDITIONAL_IF = 1 << 0
+_CONDITIONAL_THEN = 1 << 1
+_CONDITIONAL_IMPLIES = 1 << 2
+_DISJUNCTIVE = 1 << 3
+_UNIVERSAL = 1 << 4
+
+# Each named group matches one keyword class; the group name of a match maps
+# straight to its bit, so the premise needs no lowercasing or per-word lookup.
+_KEYWORD_FLAGS = {
+    "cond_if": _CONDITIONAL_IF,
+    "cond_then": _CONDITIONAL_THEN,
+    "cond_implies": _CONDITIONAL_IMPLIES,
+    "disj": _DISJUNCTIVE,
+    "universal": _UNIVERSAL
+}
+
+_KEYWORDS_RE = re.compile(
+    r"\b(?:(?P<cond_if>if)|(?P<cond_then>then)|(?P<cond_implies>implies)"
+    r"|(?P<disj>either|or|neither)"
+    r"|(?P<universal>all|every|everyone|everybody|everything|always|never|no one))\b",
+    re.IGNORECASE
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+_QUALIFYING_WORDS = frozenset({
+    "most", "many", "some", "typically", "generally", "usually", "often"
+})
+
+_ESTABLISHED_TRUTHS = (
+    "all humans are mortal",
+    "all living things die",
+    "all circles are round",
+    "all bachelors are unmarried",
+    "all mothers are female"
+)
+
+_ERROR_DESCRIPTIONS = {
+    "hasty_generalization": "The major premise makes a sweeping generalization without sufficient evidence",
+    "affirming_consequent": "This commits the fallacy of affirming the consequent in conditional reasoning",
+    "undistributed_middle": "The middle term is not properly distributed, making the conclusion invalid",
+    "incomplete_premises": "One or more premises are missing or incomplete"
+}
+
+
+def evaluate_syllogism(major_premise: str, minor_premise: str, conclusion: str, pretty: bool = False) -> str:
     """
     Evaluate the logical validity of a syllogism.
 
@@ -21,6 +74,8 @@ def evaluate_syllogism(major_premise: str, minor_premise: str, conclusion: str)
         major_premise: The major premise statement (universal statement)
         minor_premise: The minor premise statement (specific statement)
         conclusion: The conclusion statement (derived statement)
+        pretty: Indent the returned JSON for human readers instead of
+            returning compact JSON
 
     Returns:
         JSON string containing detailed validity analysis including:
@@ -29,6 +84,23 @@ def evaluate_syllogism(major_premise: str, minor_premise: str, conclusion: str)
         - analysis: detailed explanation of the logical structure
         - errors: list of identified logical fallacies or errors
     """
+    if not all(isinstance(statement, str) for statement in (major_premise, minor_premise, conclusion)):
+        # Arguments come from the model and may be of any JSON type; those
+        # bypass the cache so the analysis reports them as an error result
+        return _dumps(_evaluate_syllogism_impl(major_premise, minor_premise, conclusion), pretty)
+    if len(major_premise) + len(minor_premise) + len(conclusion) > _MAX_CACHED_TEXT_LENGTH:
+        return _evaluate_syllogism_cached.__wrapped__(major_premise, minor_premise, conclusion, pretty)
+    return _evaluate_syllogism_cached(major_premise, minor_premise, conclusion, pretty)
+
+
+@lru_cache(maxsize=512)
+def _evaluate_syllogism_cached(major_premise: str, minor_premise: str, conclusion: str, pretty: bool) -> str:
+    """Evaluate a syllogism, memoizing results for repeated tool calls."""
+    return _dumps(_evaluate_syllogism_impl(major_premise, minor_premise, conclusion), pretty)
+
+
+def _evaluate_syllogism_impl(major_premise: str, minor_premise: str, conclusion: str) -> Dict[str, Any]:
+    """Evaluate a syllogism and return the result as a dict."""
     try:
         analysis_result: Dict[str, Any] = {
             "major_premise": major_premise,
@@ -43,50 +115,48 @@ def evaluate_syllogism(major_premise: str, minor_premise: str, conclusion: str)
         if not all([major_premise.strip(), minor_premise.strip(), conclusion.strip()]):
             analysis_result["errors"].append("incomplete_premises")
             analysis_result["analysis"] = "One or more premises are empty or missing."
-            return json.dumps(analysis_result, indent=2)
+            return analysis_result
 
-        if any(word in major_premise.lower() for word in ["if ", "then ", "implies"]):
+        major_lower = major_premise.lower()
+        minor_lower = minor_premise.lower()
+        conclusion_lower = conclusion.lower()
+
+        major_flags = _keyword_flags(major_premise)
+        if major_flags & (_CONDITIONAL_IF | _CONDITIONAL_THEN | _CONDITIONAL_IMPLIES):
             analysis_result["form"] = "conditional"
-        elif any(word in major_premise.lower() for word in [" either ", " or ", " neither "]):
+        elif major_flags & _DISJUNCTIVE:
             analysis_result["form"] = "disjunctive"
         else:
             analysis_result["form"] = "categorical"
 
-        major_lower = major_premise.lower()
-        if any(word in major_lower for word in ["all", "every", "always", "never", "no one", "everyone"]):
-            if not _has_sufficient_evidence(major_premise):
+        if major_flags & _UNIVERSAL:
+            if not _has_sufficient_evidence(major_lower):
                 analysis_result["errors"].append("hasty_generalization")
 
         if analysis_result["form"] == "conditional":
-            if "if" in major_lower and "then" in major_lower:
-                if _is_affirming_consequent(major_premise, minor_premise, conclusion):
+            if major_flags & _CONDITIONAL_IF and major_flags & _CONDITIONAL_THEN:
+                if _is_affirming_consequent(major_lower, minor_lower, conclusion_lower):
                     analysis_result["errors"].append("affirming_consequent")
                     analysis_result["valid"] = False
-                elif _is_valid_modus_ponens(major_premise, minor_premise, conclusion):
+                elif _is_valid_modus_ponens(major_lower, minor_lower, conclusion_lower):
                     analysis_result["valid"] = True
         elif analysis_result["form"] == "categorical":
-            if _has_undistributed_middle(major_premise, minor_premise, conclusion):
+            if _has_undistributed_middle(major_lower, minor_lower, conclusion_lower):
                 analysis_result["errors"].append("undistributed_middle")
                 analysis_result["valid"] = False
-            elif _is_valid_categorical_syllogism(major_premise, minor_premise, conclusion):
+            elif _is_valid_categorical_syllogism(major_lower, minor_lower, conclusion_lower):
                 analysis_result["valid"] = True
 
         if analysis_result["valid"] and not analysis_result["errors"]:
             analysis_result["analysis"] = f"This is a valid {analysis_result['form']} syllogism. The logical structure is sound and the conclusion follows from the premises."
         elif analysis_result["errors"]:
-            error_descriptions = {
-                "hasty_generalization": "The major premise makes a sweeping generalization without sufficient evidence",
-                "affirming_consequent": "This commits the fallacy of affirming the consequent in conditional reasoning",
-                "undistributed_middle": "The middle term is not properly distributed, making the conclusion invalid",
-                "incomplete_premises": "One or more premises are missing or incomplete"
-            }
-            error_details = [error_descriptions.get(error, error) for error in analysis_result["errors"]]
+            error_details = [_ERROR_DESCRIPTIONS.get(error, error) for error in analysis_result["errors"]]
             error_details_filtered = [detail for detail in error_details if detail is not None]
             analysis_result["analysis"] = f"This {analysis_result['form']} syllogism contains logical errors: {', '.join(error_details_filtered)}. The conclusion does not necessarily follow from the premises."
         else:
             analysis_result["analysis"] = f"This {analysis_result['form']} syllogism requires further analysis to determine validity."
 
-        return json.dumps(analysis_result, indent=2)
+        return analysis_result
 
     except Exception as e:
         logger.error("Error in evaluate_syllogism: %s", e)
@@ -99,58 +169,60 @@ def evaluate_syllogism(major_premise: str, minor_premise: str, conclusion: str)
             "analysis": f"Error occurred during analysis: {str(e)}",
             "errors": ["analysis_error"]
         }
-        return json.dumps(error_result, indent=2)
-
-
-def _has_sufficient_evidence(premise: str) -> bool:
-    premise_lower = premise.lower()
-    qualifying_words = ["most", "many", "some", "typically", "generally", "usually", "often"]
-    has_qualifiers = any(word in premise_lower for word in qualifying_words)
-    established_truths = [
-        "all humans are mortal",
-        "all living things die",
-        "all circles are round",
-        "all bachelors are unmarried",
-        "all mothers are female"
-    ]
-    is_established_truth = any(truth in premise_lower for truth in established_truths)
+        return error_result
+
+
+def _dumps(result: Dict[str, Any], pretty: bool) -> str:
+    """Serialize a tool result, compact unless pretty output is requested."""
+    if pretty:
+        return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
+def _keyword_flags(text: str) -> int:
+    flags = 0
+    for match in _KEYWORDS_RE.finditer(text):
+        flags |= _KEYWORD_FLAGS[match.lastgroup]
+    return flags
+
+
+# The helpers below take premises that the caller has already lowercased.
+def _has_sufficient_evidence(premise_lower: str) -> bool:
+    has_qualifiers = not _QUALIFYING_WORDS.isdisjoint(_WORD_RE.findall(premise_lower))
+    is_established_truth = any(truth in premise_lower for truth in _ESTABLISHED_TRUTHS)
     return has_qualifiers or is_established_truth
 
 
-def _is_affirming_consequent(major: str, minor: str, _conclusion: str) -> bool:
-    if not ("if" in major.lower() and "then" in major.lower()):
+def _is_affirming_consequent(major_lower: str, minor_lower: str, _conclusion_lower: str) -> bool:
+    if not ("if" in major_lower and "then" in major_lower):
         return False
-    major_parts = major.lower().split("then")
+    major_parts = major_lower.split("then")
     if len(major_parts) < 2:
         return False
     consequent_words = major_parts[1].strip().split()[:3]
-    minor_words = minor.lower().split()
+    minor_words = minor_lower.split()
     return any(word in minor_words for word in consequent_words if len(word) > 2)
 
 
-def _is_valid_modus_ponens(major: str, minor: str, _conclusion: str) -> bool:
-    if not ("if" in major.lower() and "then" in major.lower()):
+def _is_valid_modus_ponens(major_lower: str, minor_lower: str, _conclusion_lower: str) -> bool:
+    if not ("if" in major_lower and "then" in major_lower):
         return False
-    major_lower = major.lower()
     if_pos = major_lower.find("if")
     then_pos = major_lower.find("then")
     if if_pos == -1 or then_pos == -1 or then_pos <= if_pos:
         return False
     antecedent = major_lower[if_pos + 2:then_pos].strip()
     antecedent_words = antecedent.split()[:3]
-    minor_words = minor.lower().split()
+    minor_words = minor_lower.split()
     return any(word in minor_words for word in antecedent_words if len(word) > 2)
 
 
-def _has_undistributed_middle(major: str, minor: str, _conclusion: str) -> bool:
-    return ("some" in major.lower() and "some" in minor.lower() and
-            not any(word in major.lower() for word in ["all", "every"]))
+def _has_undistributed_middle(major_lower: str, minor_lower: str, _conclusion_lower: str) -> bool:
+    return ("some" in major_lower and "some" in minor_lower and
+            not any(word in major_lower for word in ("all", "every")))
 
 
-def _is_valid_categorical_syllogism(major: str, minor: str, conclusion: str) -> bool:
-    major_lower = major.lower()
-    minor_lower = minor.lower()
-    conclusion.lower()
+def _is_valid_categorical_syllogism(major_lower: str, minor_lower: str, _conclusion_lower: str) -> bool:
     if ("all" in major_lower or "every" in major_lower) and " is " in minor_lower:
         return True
     if (("all" in major_lower or "every" in major_lower) and
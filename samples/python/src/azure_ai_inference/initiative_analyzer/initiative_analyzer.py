@@ -16,34 +16,137 @@ Features:
 
 import argparse
 import csv
+import hashlib
+import json
 import logging
+import math
 import os
 import re
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from itertools import chain, compress
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
-
-from azure.ai.projects import AIProjectClient
-from azure.identity import DefaultAzureCredential
-from openai import AzureOpenAI
-from pydantic import BaseModel
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    cast,
+)
+
+# The Azure SDK, OpenAI and pydantic imports are deferred to the code paths that
+# call the language model, so CSV loading and --help do not pay for them.
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+    from openai import AzureOpenAI
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+try:
+    import re2
+except ImportError:
+    # google-re2 is optional; title filters use the stdlib engine when it is missing
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; cache entries and batch files use the stdlib json module when it is missing
+    orjson = None
 
 # Configure logging for debugging and monitoring (default configuration)
 # This will be updated by configure_logging() function based on verbose setting
 logger = logging.getLogger(__name__)
 
+# Block size used by the PyArrow CSV reader; larger blocks mean fewer parser
+# handoffs on large backlog exports.
+_CSV_BLOCK_SIZE = 4 << 20
+
+# Translation table replacing characters that are invalid in filenames
+_FILENAME_INVALID_CHARS = '<>:"/\\|?*'
+_SANITIZE_FILENAME_TABLE = str.maketrans(_FILENAME_INVALID_CHARS, '_' * len(_FILENAME_INVALID_CHARS))
+
+# Flags for writing report files through a raw file descriptor
+_REPORT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0)
+
+# Minimum number of reports before markdown generation is spread across worker
+# processes; below this, starting the pool costs more than it saves.
+_PARALLEL_REPORT_THRESHOLD = 16
+
+# Maximum number of threads writing report files for smaller report sets
+_MAX_REPORT_WRITER_THREADS = 16
+
+# Maximum number of language model requests in flight at once. The calls are
+# network-bound, so they run on threads sharing one client and its connection
+# pool; the OpenAI client retries rate-limited and unavailable responses with
+# exponential backoff on its own.
+_MAX_CONCURRENT_REQUESTS = 16
+
+# Seconds between status checks of a submitted batch job, and the statuses
+# after which a batch job will not change any more
+_BATCH_POLL_INTERVAL = 30.0
+_BATCH_TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+# Initiatives whose free-text fields are longer than this in total are
+# condensed once per run before being sent with every chunk of backlog items
+_INITIATIVE_CONDENSE_THRESHOLD = 2000
 
-def chunk_backlog_items(backlog_items: List['BacklogItem'], chunk_size: int = 20) -> List[List['BacklogItem']]:
+# Condensed initiatives, keyed by the original field values and model name
+_condensed_initiatives: Dict[Tuple[Tuple[str, ...], str], 'Initiative'] = {}
+
+# Maximum length in characters of the initiative list in the item-centric
+# system prompt, about 15,000 tokens. The list is sent with every backlog item,
+# so when it is longer the longest descriptions are condensed to fit
+_ITEM_CENTRIC_CONTEXT_LIMIT = 60_000
+
+# Condensed item-centric descriptions, keyed by the initiative title and
+# description, the model name and the maximum length
+_condensed_descriptions: Dict[Tuple[str, str, str, int], str] = {}
+
+# Default directory for cached initiative relevance results
+_DEFAULT_CACHE_DIR = '.initiative_cache'
+
+# Maximum number of entries kept in the cache directory; after each run the
+# least recently used entries beyond this are deleted
+_MAX_CACHE_ENTRIES = 10_000
+
+# Request options for --latency-optimized: Azure OpenAI priority processing
+# serves these requests with lower, more consistent latency at a higher price
+_LATENCY_OPTIMIZED_OPTIONS: Dict[str, Any] = {"service_tier": "priority"}
+
+
+def chunk_backlog_items(backlog_items: List['BacklogItem'], chunk_size: int = 20) -> Iterator[List['BacklogItem']]:
     """
     Split backlog items into chunks of specified size for batch processing.
 
+    Chunks are produced lazily, so only the chunk being processed is held
+    in memory.
+
     Args:
         backlog_items: List of BacklogItem objects to chunk
         chunk_size: Maximum number of items per chunk (default: 20)
 
     Returns:
-        List of chunks, each containing up to chunk_size BacklogItem objects
+        Iterator over chunks, each containing up to chunk_size BacklogItem objects
 
     Raises:
         ValueError: If chunk_size is less than 1
@@ -51,24 +154,36 @@ def chunk_backlog_items(backlog_items: List['BacklogItem'], chunk_size: int = 20
     if chunk_size < 1:
         raise ValueError("chunk_size must be at least 1")
 
-    if not backlog_items:
-        return []
+    logger.debug("Splitting %d backlog items into %d chunks of size %d",
+                len(backlog_items), count_chunks(len(backlog_items), chunk_size), chunk_size)
+
+    return (backlog_items[i:i + chunk_size] for i in range(0, len(backlog_items), chunk_size))
+
+
+def _backlog_item_text_length(item: 'BacklogItem') -> int:
+    """Approximate a backlog item's prompt size by the length of its free text."""
+    return len(item.title) + len(item.goal)
 
-    chunks: List[List[BacklogItem]] = []
-    for i in range(0, len(backlog_items), chunk_size):
-        chunk = backlog_items[i:i + chunk_size]
-        chunks.append(chunk)
 
-    logger.debug("Split %d backlog items into %d chunks of size %d",
-                len(backlog_items), len(chunks), chunk_size)
+def count_chunks(item_count: int, chunk_size: int) -> int:
+    """Return the number of chunks chunk_backlog_items produces for item_count items."""
+    return -(-item_count // chunk_size)
 
-    return chunks
+
+# Field names of the CSV-backed dataclasses, in column order; the getters read
+# every field of an instance as a tuple in a single call.
+_BACKLOG_FIELDS = ('category', 'initiative', 'title', 'goal', 'stream')
+_INITIATIVE_FIELDS = ('area', 'title', 'details', 'description', 'kpi', 'current_state', 'solutions')
+_get_backlog_fields = attrgetter(*_BACKLOG_FIELDS)
+_get_initiative_fields = attrgetter(*_INITIATIVE_FIELDS)
 
 
 @dataclass
 class BacklogItem:
     """Represents a single backlog item with its metadata."""
 
+    __slots__ = _BACKLOG_FIELDS
+
     category: str
     initiative: str
     title: str
@@ -77,19 +192,15 @@ class BacklogItem:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert backlog item to dictionary format."""
-        return {
-            'category': self.category,
-            'initiative': self.initiative,
-            'title': self.title,
-            'goal': self.goal,
-            'stream': self.stream
-        }
+        return dict(zip(_BACKLOG_FIELDS, _get_backlog_fields(self)))
 
 
 @dataclass
 class Initiative:
     """Represents an organizational initiative."""
 
+    __slots__ = _INITIATIVE_FIELDS
+
     area: str
     title: str
     details: str
@@ -100,21 +211,15 @@ class Initiative:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert initiative to dictionary format."""
-        return {
-            'area': self.area,
-            'title': self.title,
-            'details': self.details,
-            'description': self.description,
-            'kpi': self.kpi,
-            'current_state': self.current_state,
-            'solutions': self.solutions
-        }
+        return dict(zip(_INITIATIVE_FIELDS, _get_initiative_fields(self)))
 
 
 @dataclass
 class BacklogItemAssociation:
     """Represents a backlog item associated with an initiative."""
 
+    __slots__ = ('backlog_item', 'confidence', 'impact_analysis')
+
     backlog_item: BacklogItem
     confidence: int
     impact_analysis: str
@@ -124,6 +229,9 @@ class BacklogItemAssociation:
 class InitiativeReport:
     """Represents a complete initiative report with associated backlog items."""
 
+    __slots__ = ('initiative', 'associated_items', 'confidence_threshold',
+                 'collective_impact', 'strategic_recommendations')
+
     initiative: Initiative
     associated_items: List[BacklogItemAssociation]
     confidence_threshold: int
@@ -135,6 +243,10 @@ class InitiativeReport:
 class EnrichedBacklogItem:
     """Represents a backlog item enriched with AI analysis."""
 
+    __slots__ = ('original_item', 'matched_initiative', 'secondary_initiatives',
+                 'category_confidence', 'initiative_confidence', 'impact_analysis',
+                 'detailed_analysis', 'resource_implications', 'recommendations')
+
     original_item: BacklogItem
     matched_initiative: Optional[str]
     secondary_initiatives: List[str]
@@ -165,6 +277,9 @@ class EnrichedBacklogItem:
 class InitiativeBacklogAssociation:
     """Represents the result of analyzing backlog items for a specific initiative."""
 
+    __slots__ = ('backlog_item_title', 'initiative_title', 'relevance_score', 'impact_analysis',
+                 'strategic_value', 'implementation_synergies', 'confidence_reasoning')
+
     backlog_item_title: str
     initiative_title: str  # Add initiative title to track which initiative this association belongs to
     relevance_score: int
@@ -182,32 +297,245 @@ class InitiativeBacklogAssociation:
         )
 
 
-# Pydantic models for structured outputs
-class BacklogAnalysisResult(BaseModel):
-    """Structured output model for backlog item analysis."""
-    primary_initiative: Optional[str]
-    secondary_initiatives: List[str]
-    category_confidence: int
-    initiative_confidence: int
-    impact_analysis: str
-    detailed_analysis: str
-    resource_implications: str
-    recommendations: List[str]
+class _CompletionTokenBudget:
+    """
+    Adaptive max_tokens limit for one kind of structured-output request.
+
+    Records the completion tokens used by recent responses and caps later
+    requests at the 99th percentile plus a safety margin, so the service does
+    not reserve capacity for output the schema never needs. Until enough
+    responses have been seen the default limit is used, and the limit never
+    rises above it. Usage can be recorded per unit of a scale (for example per
+    backlog item in a chunk) so the limit grows with the request size. A
+    response truncated at a reduced limit is retried at the default limit.
+    """
+
+    __slots__ = ('default_limit', 'min_limit', 'min_samples', '_samples', '_lock')
+
+    def __init__(self, default_limit: int, min_limit: int = 256, window: int = 500, min_samples: int = 20) -> None:
+        self.default_limit = default_limit
+        self.min_limit = min_limit
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def limit(self, scale: int = 1) -> int:
+        """Return the max_tokens value to use for a request of the given scale."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.default_limit
+            samples = sorted(self._samples)
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return min(self.default_limit, max(self.min_limit, math.ceil(p99 * scale * 1.2)))
+
+    def record(self, completion: Any, scale: int = 1) -> None:
+        """Record the completion tokens used by a response, if reported."""
+        usage = getattr(completion, 'usage', None)
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        if isinstance(completion_tokens, int) and scale > 0:
+            with self._lock:
+                self._samples.append(completion_tokens / scale)
+
+    def parse(self, client: 'AzureOpenAI', scale: int = 1, **request: Any) -> Any:
+        """
+        Send a structured-output request with max_tokens from this budget.
+
+        A response cut off at a reduced limit raises LengthFinishReasonError
+        from parse; its usage is recorded so the limit can grow, and the
+        request is retried once at the default limit before the error is
+        passed on.
+
+        Args:
+            client: Azure OpenAI client
+            scale: Request size the limit and recorded usage are scaled by
+            **request: Arguments for client.beta.chat.completions.parse
+
+        Returns:
+            The parsed chat completion
+        """
+        from openai import LengthFinishReasonError
+
+        max_tokens = self.limit(scale)
+        try:
+            completion = client.beta.chat.completions.parse(max_tokens=max_tokens, **request)
+        except LengthFinishReasonError as e:
+            self.record(e.completion, scale)
+            if max_tokens >= self.default_limit:
+                raise
+            logger.warning("Response truncated at %d completion tokens; retrying with %d",
+                           max_tokens, self.default_limit)
+            completion = client.beta.chat.completions.parse(max_tokens=self.default_limit, **request)
+        self.record(completion, scale)
+        return completion
+
+
+# Completion token budgets for the item-centric, analyze_backlog_item and
+# initiative relevance requests
+_ITEM_ANALYSIS_TOKENS = _CompletionTokenBudget(1000)
+_BACKLOG_ANALYSIS_TOKENS = _CompletionTokenBudget(1500)
+_RELEVANCE_ANALYSIS_TOKENS = _CompletionTokenBudget(2000)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize JSON to compact, key-sorted UTF-8 bytes.
 
+    Uses orjson when installed. The stdlib fallback produces the same bytes
+    for the str, int and list values used here, so cache keys do not depend
+    on which serializer is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
-class InitiativeRelevanceItem(BaseModel):
-    """Model for a single relevant backlog item in initiative analysis."""
-    backlog_item_title: str
-    relevance_score: int
-    impact_analysis: str
-    strategic_value: str
-    implementation_synergies: str
-    confidence_reasoning: str
 
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _analysis_cache_key(model_name: str, system_prompt: str, user_prompt: str) -> str:
+    """Return the cache key for an analysis request."""
+    payload = _json_dumps({"model": model_name, "sys": system_prompt, "usr": user_prompt})
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _read_cache_entry(cache_dir: str, key: str) -> bytes:
+    """Read a cache entry and mark it as recently used for cache pruning."""
+    entry_path = Path(cache_dir) / f"{key}.json"
+    data = entry_path.read_bytes()
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+    return data
+
+
+def _load_cached_associations(cache_dir: str, key: str) -> Optional[List[InitiativeBacklogAssociation]]:
+    """
+    Load cached initiative relevance results.
+
+    Returns:
+        The cached associations, or None if there is no usable cache entry
+    """
+    try:
+        cached_data = _json_loads(_read_cache_entry(cache_dir, key))
+        return [InitiativeBacklogAssociation(**data) for data in cached_data]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+        return None
+
+
+def _load_cached_item_analysis(cache_dir: str, key: str, item: BacklogItem) -> Optional[EnrichedBacklogItem]:
+    """
+    Load a cached item-centric analysis result for a backlog item.
+
+    Returns:
+        The cached enriched item, or None if there is no usable cache entry
+    """
+    try:
+        cached_data = _json_loads(_read_cache_entry(cache_dir, key))
+        return EnrichedBacklogItem(original_item=item, **cached_data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+        return None
+
+
+def _write_cache_entry(cache_dir: str, key: str, data: Any) -> None:
+    """Store a cache entry; failures are logged and otherwise ignored."""
+    cache_path = Path(cache_dir)
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        temp_path = cache_path / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        temp_path.write_bytes(_json_dumps(data))
+        os.replace(temp_path, cache_path / f"{key}.json")
+    except OSError as e:
+        logger.warning("Failed to write cache entry %s: %s", key, e)
+
+
+def _prune_cache_dir(cache_dir: str, max_entries: int = _MAX_CACHE_ENTRIES) -> int:
+    """
+    Delete the least recently used cache entries beyond max_entries.
+
+    Entries are ordered by modification time, which is updated whenever an
+    entry is written or read. Failures are logged and otherwise ignored.
+
+    Args:
+        cache_dir: The cache directory
+        max_entries: Maximum number of entries to keep
+
+    Returns:
+        int: The number of entries deleted
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith('.json')]
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logger.warning("Failed to list cache directory %s: %s", cache_dir, e)
+        return 0
+
+    if len(entries) <= max_entries:
+        return 0
+
+    def last_used(entry: 'os.DirEntry[str]') -> float:
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    entries.sort(key=last_used)
+    deleted = 0
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.unlink(entry.path)
+            deleted += 1
+        except OSError as e:
+            logger.warning("Failed to delete cache entry %s: %s", entry.name, e)
+
+    logger.info("Pruned %d least recently used entries from cache %s", deleted, cache_dir)
+    return deleted
+
+
+def _store_cached_associations(cache_dir: str, key: str, associations: List[InitiativeBacklogAssociation]) -> None:
+    """Store initiative relevance results."""
+    _write_cache_entry(cache_dir, key, [asdict(association) for association in associations])
+
+
+def _store_cached_item_analysis(cache_dir: str, key: str, enriched_item: EnrichedBacklogItem) -> None:
+    """Store an item-centric analysis result without its original backlog item."""
+    cached_data = asdict(enriched_item)
+    del cached_data['original_item']
+    _write_cache_entry(cache_dir, key, cached_data)
 
-class InitiativeRelevanceResult(BaseModel):
-    """Structured output model for initiative relevance analysis."""
-    relevant_items: List[InitiativeRelevanceItem]
+
+def _condensed_initiative_cache_key(initiative_fields: Tuple[str, ...], model_name: str) -> str:
+    """Return the cache key for the condensed form of an initiative."""
+    payload = _json_dumps({"model": model_name, "condense": list(initiative_fields)})
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _load_cached_condensed_initiative(cache_dir: str, key: str) -> Optional[Initiative]:
+    """
+    Load a cached condensed initiative.
+
+    Returns:
+        The cached initiative, or None if there is no usable cache entry
+    """
+    try:
+        return Initiative(**_json_loads(_read_cache_entry(cache_dir, key)))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+        return None
 
 
 def configure_logging(verbose_level: str = 'ERROR') -> None:
@@ -305,10 +633,12 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--processing-mode",
         type=str,
-        choices=['item-centric', 'initiative-centric'],
+        choices=['item-centric', 'item-centric-batch', 'initiative-centric'],
         default='initiative-centric',
         help="""Processing approach:
         - item-centric: Legacy mode that analyzes each backlog item individually (less efficient)
+        - item-centric-batch: Item-centric analysis submitted as one Batch API job for offline runs
+          (discounted, but may take up to 24 hours; requires a batch model deployment)
         - initiative-centric: Recommended mode that analyzes batches of items per initiative (80%% fewer API calls)
         Default: initiative-centric"""
     )
@@ -318,6 +648,28 @@ def parse_arguments() -> argparse.Namespace:
         help="""Additional instructions to include in the AI analysis prompt.
         Example: 'Exclude backlog items that would require very detailed and specific engineering understanding of the code base to implement'"""
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=_DEFAULT_CACHE_DIR,
+        help=f"Directory for caching item-centric and initiative-centric analysis results between runs (default: {_DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--prescreen-model",
+        type=str,
+        help="Cheaper model deployment used to skip initiative-centric chunks with no relevant items before the full analysis"
+    )
+    parser.add_argument(
+        "--latency-optimized",
+        action="store_true",
+        help="Request priority processing for the analysis calls for lower latency at a higher price "
+             "(item-centric and initiative-centric modes; the deployment must support priority processing)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the analysis result cache and always call the model"
+    )
     return parser.parse_args()
 
 
@@ -332,7 +684,21 @@ def load_environment() -> None:
         logger.info("python-dotenv not available, using system environment variables")
 
 
-def initialize_client(endpoint: Optional[str] = None) -> AzureOpenAI:
+@lru_cache(maxsize=1)
+def _get_credential() -> 'DefaultAzureCredential':
+    """
+    Return the process-wide Azure credential, creating it on first use.
+
+    DefaultAzureCredential remembers which credential in its chain succeeded
+    and caches the tokens it acquires, refreshing them before they expire, so
+    sharing one instance means the probe chain only runs once per process.
+    """
+    from azure.identity import DefaultAzureCredential
+
+    return DefaultAzureCredential()
+
+
+def initialize_client(endpoint: Optional[str] = None) -> 'AzureOpenAI':
     """
     Initialize and test the Azure AI Projects client and get Azure OpenAI client.
 
@@ -356,8 +722,10 @@ def initialize_client(endpoint: Optional[str] = None) -> AzureOpenAI:
         )
         sys.exit(1)
 
-    # Configure authentication using DefaultAzureCredential
-    credential = DefaultAzureCredential()
+    from azure.ai.projects import AIProjectClient
+
+    # Configure authentication using the shared DefaultAzureCredential
+    credential = _get_credential()
 
     try:
         # Create the Azure AI Projects client
@@ -387,13 +755,156 @@ def initialize_client(endpoint: Optional[str] = None) -> AzureOpenAI:
         sys.exit(1)
 
 
-def load_backlog_items(file_path: str, title_filter: Optional[str] = None) -> List[BacklogItem]:
+@lru_cache(maxsize=32)
+def _compile_title_filter(title_filter: str) -> Pattern[str]:
+    """
+    Compile a case-insensitive title filter pattern.
+
+    Compiled patterns are cached, so loading several files with the same
+    filter compiles it only once.
+
+    The pattern is validated with the stdlib engine and then matched with RE2
+    when google-re2 is installed, so it runs in linear time per title. Patterns
+    that use features RE2 does not support, such as lookarounds and
+    backreferences, fall back to the stdlib engine.
+
+    Raises:
+        ValueError: If the regex pattern is invalid
+    """
+    try:
+        title_pattern = re.compile(title_filter, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern '{title_filter}': {e}") from e
+
+    if re2 is not None:
+        try:
+            return re2.compile(f"(?i){title_filter}")
+        except re2.error:
+            logger.debug("Title filter '%s' is not supported by RE2, using re", title_filter)
+    return title_pattern
+
+
+def _log_invalid_csv_row(expected_columns: int, actual_columns: int, text: str) -> None:
+    """Log a CSV row whose field count does not match the header."""
+    logger.warning("Skipping malformed CSV row (expected %d columns, found %d): %s",
+                   expected_columns, actual_columns, text)
+
+
+def _collect_csv_columns(
+    reader: Iterator[List[str]],
+    fieldnames: List[str],
+    columns: List[str]
+) -> Dict[str, List[str]]:
+    """
+    Collect the values of the given columns from the data rows of a csv.reader.
+
+    Rows with fewer fields than the header are logged and skipped. Fields
+    beyond the header, such as a trailing comma, are ignored and the row is
+    kept, as csv.DictReader did.
+    """
+    column_values: Dict[str, List[str]] = {col: [] for col in columns}
+    appenders = [(column_values[col].append, fieldnames.index(col)) for col in columns]
+    for fields in reader:
+        if len(fields) < len(fieldnames):
+            if fields:
+                _log_invalid_csv_row(len(fieldnames), len(fields), ','.join(fields))
+            continue
+        for append, index in appenders:
+            append(fields[index])
+    return column_values
+
+
+def _read_csv_columns(
+    file_path: str,
+    required_columns: List[str],
+    optional_columns: List[str],
+    csv_label: str
+) -> Dict[str, List[str]]:
+    """
+    Read the required and optional columns of a CSV file as lists of strings.
+
+    The columns are returned column-major so that bulk operations such as the
+    title filter only walk the values they need. Uses the PyArrow CSV parser
+    when pyarrow is installed, otherwise csv.reader. Either way, rows with
+    fewer fields than the header are logged and skipped, so every column has
+    one string value per row.
+
+    Args:
+        file_path: Path to the CSV file
+        required_columns: Columns that must be present in the header
+        optional_columns: Columns to read when present in the header; missing
+            optional columns are filled with empty strings
+        csv_label: Name of the CSV used in error messages
+
+    Returns:
+        Dict[str, List[str]]: The values of each column, keyed by column name
+
+    Raises:
+        ValueError: If required columns are missing
+    """
+    with open(file_path, encoding='utf-8', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        fieldnames = next(reader, [])
+
+        missing_columns = [col for col in required_columns if col not in fieldnames]
+        if missing_columns:
+            raise ValueError(f"Missing required columns in {csv_label} CSV: {missing_columns}")
+
+        columns = [col for col in required_columns + optional_columns if col in fieldnames]
+
+        if pa_csv is None:
+            column_values = _collect_csv_columns(reader, fieldnames, columns)
+
+    if pa_csv is not None:
+        # PyArrow can only skip a row with extra fields, not keep its leading
+        # fields, so invalid rows are collected and a file with any such row
+        # is read again with csv.reader
+        invalid_rows: List[Any] = []
+
+        def skip_invalid_row(row: Any) -> str:
+            invalid_rows.append(row)
+            return 'skip'
+
+        column_values = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(
+                newlines_in_values=True,
+                invalid_row_handler=skip_invalid_row
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={col: pa.string() for col in columns},
+                strings_can_be_null=False
+            )
+        ).to_pydict()
+
+        if any(row.actual_columns > row.expected_columns for row in invalid_rows):
+            logger.info("%s CSV has rows with extra fields; reading it with csv.reader", csv_label)
+            with open(file_path, encoding='utf-8', newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader, None)
+                column_values = _collect_csv_columns(reader, fieldnames, columns)
+        else:
+            for row in invalid_rows:
+                _log_invalid_csv_row(row.expected_columns, row.actual_columns, row.text)
+
+    row_count = len(column_values[required_columns[0]])
+    for col in optional_columns:
+        if col not in column_values:
+            column_values[col] = [''] * row_count
+
+    return column_values
+
+
+def load_backlog_items(file_path: str, title_filter: Optional[Union[str, Pattern[str]]] = None) -> List[BacklogItem]:
     """
     Load backlog items from CSV file.
 
     Args:
         file_path: Path to the backlog CSV file
-        title_filter: Optional regex pattern to filter backlog items by title
+        title_filter: Optional regex pattern, or pattern compiled with
+            _compile_title_filter, to filter backlog items by title
 
     Returns:
         List of BacklogItem objects (filtered by title if pattern provided)
@@ -407,52 +918,41 @@ def load_backlog_items(file_path: str, title_filter: Optional[str] = None) -> Li
 
     # Compile regex pattern if provided
     title_pattern = None
-    if title_filter:
-        try:
-            title_pattern = re.compile(title_filter, re.IGNORECASE)
-            logger.info("Using title filter pattern: %s", title_filter)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern '{title_filter}': {e}") from e
+    if isinstance(title_filter, str):
+        title_pattern = _compile_title_filter(title_filter) if title_filter else None
+    elif title_filter is not None:
+        title_pattern = title_filter
+        title_filter = title_filter.pattern
+    if title_pattern:
+        logger.info("Using title filter pattern: %s", title_filter)
 
     required_columns = ['category', 'title', 'goal', 'stream']
 
-    backlog_items: List[BacklogItem] = []
-    filtered_count = 0
-
-    with open(file_path, encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-
-        # Validate required columns (handle Optional fieldnames)
-        fieldnames = list(reader.fieldnames or [])
-        missing_columns = [col for col in required_columns if col not in fieldnames]
-        if missing_columns:
-            raise ValueError(f"Missing required columns in backlog CSV: {missing_columns}")
-
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                title = row['title'].strip()
-
-                # Apply title filter if provided
-                if title_pattern and not title_pattern.search(title):
-                    filtered_count += 1
-                    continue
-
-                # Create backlog item
-                item = BacklogItem(
-                    category=row['category'].strip(),
-                    initiative=row.get('initiative', '').strip(),
-                    title=title,
-                    goal=row['goal'].strip(),
-                    stream=row['stream'].strip()
-                )
-
-                backlog_items.append(item)
+    columns = _read_csv_columns(file_path, required_columns, ['initiative'], 'backlog')
+    titles = [title.strip() for title in columns['title']]
+    rows: Iterable[Tuple[str, ...]] = zip(
+        columns['category'], columns['initiative'], titles, columns['goal'], columns['stream']
+    )
 
-            except Exception as e:
-                logger.warning("Error processing row %d in backlog CSV: %s", row_num, e)
-                continue
+    # Apply title filter if provided, scanning only the title column
+    if title_pattern:
+        rows = compress(rows, map(title_pattern.search, titles))
+
+    # Create backlog items; the low-cardinality columns are interned
+    # so that rows with the same value share a single string
+    backlog_items = [
+        BacklogItem(
+            category=sys.intern(category.strip()),
+            initiative=sys.intern(initiative.strip()),
+            title=title,
+            goal=goal.strip(),
+            stream=sys.intern(stream.strip())
+        )
+        for category, initiative, title, goal, stream in rows
+    ]
 
-    total_items = len(backlog_items) + filtered_count
+    total_items = len(titles)
+    filtered_count = total_items - len(backlog_items)
     if title_pattern:
         logger.info("Loaded %d backlog items from %s (filtered %d items out of %d total)",
                    len(backlog_items), file_path, filtered_count, total_items)
@@ -463,13 +963,14 @@ def load_backlog_items(file_path: str, title_filter: Optional[str] = None) -> Li
     return backlog_items
 
 
-def load_initiatives(file_path: str, title_filter: Optional[str] = None) -> List[Initiative]:
+def load_initiatives(file_path: str, title_filter: Optional[Union[str, Pattern[str]]] = None) -> List[Initiative]:
     """
     Load initiatives from CSV file.
 
     Args:
         file_path: Path to the initiatives CSV file
-        title_filter: Optional regex pattern to filter initiatives by title
+        title_filter: Optional regex pattern, or pattern compiled with
+            _compile_title_filter, to filter initiatives by title
 
     Returns:
         List of Initiative objects (filtered by title if pattern provided)
@@ -483,51 +984,38 @@ def load_initiatives(file_path: str, title_filter: Optional[str] = None) -> List
 
     # Compile regex pattern if provided
     title_pattern = None
-    if title_filter:
-        try:
-            title_pattern = re.compile(title_filter, re.IGNORECASE)
-            logger.info("Using initiatives title filter: %s", title_filter)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern '{title_filter}': {e}")
+    if isinstance(title_filter, str):
+        title_pattern = _compile_title_filter(title_filter) if title_filter else None
+    elif title_filter is not None:
+        title_pattern = title_filter
+        title_filter = title_filter.pattern
+    if title_pattern:
+        logger.info("Using initiatives title filter: %s", title_filter)
 
     required_columns = ['area', 'title', 'details', 'description', 'kpi', 'current_state', 'solutions']
 
-    initiatives: List[Initiative] = []
-    filtered_count = 0
-
-    with open(file_path, encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-
-        # Validate required columns (handle Optional fieldnames)
-        fieldnames = list(reader.fieldnames or [])
-        missing_columns = [col for col in required_columns if col not in fieldnames]
-        if missing_columns:
-            raise ValueError(f"Missing required columns in initiatives CSV: {missing_columns}")
-
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                # Apply title filter if provided
-                if title_pattern and not title_pattern.search(row['title']):
-                    filtered_count += 1
-                    continue
-
-                initiative = Initiative(
-                    area=row['area'].strip(),
-                    title=row['title'].strip(),
-                    details=row['details'].strip(),
-                    description=row['description'].strip(),
-                    kpi=row['kpi'].strip(),
-                    current_state=row['current_state'].strip(),
-                    solutions=row['solutions'].strip()
-                )
-
-                initiatives.append(initiative)
+    columns = _read_csv_columns(file_path, required_columns, [], 'initiatives')
+    rows: Iterable[Tuple[str, ...]] = zip(*(columns[col] for col in required_columns))
 
-            except Exception as e:
-                logger.warning("Error processing row %d in initiatives CSV: %s", row_num, e)
-                continue
+    # Apply title filter if provided, scanning only the title column
+    if title_pattern:
+        rows = compress(rows, map(title_pattern.search, columns['title']))
+
+    initiatives = [
+        Initiative(
+            area=sys.intern(area.strip()),
+            title=title.strip(),
+            details=details.strip(),
+            description=description.strip(),
+            kpi=kpi.strip(),
+            current_state=current_state.strip(),
+            solutions=solutions.strip()
+        )
+        for area, title, details, description, kpi, current_state, solutions in rows
+    ]
 
-    total_initiatives = len(initiatives) + filtered_count
+    total_initiatives = len(columns['title'])
+    filtered_count = total_initiatives - len(initiatives)
     if title_pattern:
         logger.info("Loaded %d initiatives from %s (filtered by title: kept %d, filtered out %d of %d total)",
                    len(initiatives), file_path, len(initiatives), filtered_count, total_initiatives)
@@ -537,6 +1025,19 @@ def load_initiatives(file_path: str, title_filter: Optional[str] = None) -> List
     return initiatives
 
 
+def build_backlog_lookup(backlog_items: List[BacklogItem]) -> Dict[str, BacklogItem]:
+    """
+    Build a map of backlog item titles to backlog items.
+
+    Args:
+        backlog_items: The backlog items to index
+
+    Returns:
+        Dict[str, BacklogItem]: Backlog items keyed by title; later items win on duplicate titles
+    """
+    return {item.title: item for item in backlog_items}
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a string to be used as a filename.
@@ -547,14 +1048,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: A sanitized filename
     """
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove leading/trailing whitespace and dots
-    sanitized = sanitized.strip('. ')
-    # Limit length to avoid filesystem issues
-    if len(sanitized) > 100:
-        sanitized = sanitized[:100]
-    return sanitized
+    # Replace invalid characters, remove leading/trailing whitespace and dots,
+    # and limit length to avoid filesystem issues
+    return filename.translate(_SANITIZE_FILENAME_TABLE).strip('. ')[:100]
 
 
 def generate_initiative_markdown_report(initiative_report: InitiativeReport) -> str:
@@ -571,7 +1067,7 @@ def generate_initiative_markdown_report(initiative_report: InitiativeReport) ->
     items = initiative_report.associated_items
 
     # Generate frontmatter
-    markdown = f"""---
+    header = f"""---
 area: {initiative.area}
 title: {initiative.title}
 confidence_threshold: {initiative_report.confidence_threshold}
@@ -606,12 +1102,15 @@ The following backlog items have been associated with this initiative based on s
 """
 
     # Add table rows for each associated backlog item
-    for association in items:
-        item = association.backlog_item
-        markdown += f"| {item.title} | {item.goal} | {item.category} | {item.stream} | {association.confidence}% | {association.impact_analysis} |\n"
+    rows = [
+        f"| {association.backlog_item.title} | {association.backlog_item.goal} "
+        f"| {association.backlog_item.category} | {association.backlog_item.stream} "
+        f"| {association.confidence}% | {association.impact_analysis} |\n"
+        for association in items
+    ]
 
     # Add collective impact assessment
-    markdown += f"""
+    footer = f"""
 ## Collective Impact Assessment
 
 {initiative_report.collective_impact}
@@ -621,7 +1120,7 @@ The following backlog items have been associated with this initiative based on s
 {initiative_report.strategic_recommendations}
 """
 
-    return markdown
+    return "".join([header, *rows, footer])
 
 
 def organize_backlog_by_initiative(
@@ -644,79 +1143,29 @@ def organize_backlog_by_initiative(
     initiative_map = {init.title: init for init in initiatives}
 
     # Create a case-insensitive mapping for fuzzy matching
-    initiative_map_lower = {init.title.lower().strip(): init for init in initiatives}
+    initiative_map_folded = {init.title.casefold().strip(): init for init in initiatives}
 
     logger.info("Created initiative map with %d initiatives: %s",
                 len(initiative_map), list(initiative_map.keys()))
 
     # Group backlog items by their matched initiatives
-    initiative_associations: Dict[str, List[BacklogItemAssociation]] = {}
+    initiative_associations: DefaultDict[str, List[BacklogItemAssociation]] = defaultdict(list)
 
     logger.info("Processing %d enriched items with confidence threshold %d",
                 len(enriched_items), confidence_threshold)
 
-    for enriched_item in enriched_items:
-        logger.debug(
-            "Processing enriched item: title='%s', matched_initiative='%s', confidence=%d",
-            enriched_item.original_item.title,
-            enriched_item.matched_initiative,
-            enriched_item.initiative_confidence,
-        )
-
-        # Only include items that meet the confidence threshold
-        if (
-            enriched_item.matched_initiative
-            and enriched_item.initiative_confidence >= confidence_threshold
-        ):
-            initiative_title = enriched_item.matched_initiative
-            logger.debug(
-                "Item '%s' meets threshold - matched to initiative: '%s'",
-                enriched_item.original_item.title,
-                initiative_title,
-            )
-
-            # Try exact match first
-            matched_initiative = None
-            if initiative_title in initiative_map:
-                matched_initiative = initiative_map[initiative_title]
-                logger.debug("EXACT match found for initiative: '%s'", initiative_title)
-            else:
-                # Try case-insensitive match
-                title_lower = initiative_title.lower().strip()
-                if title_lower in initiative_map_lower:
-                    matched_initiative = initiative_map_lower[title_lower]
-                    logger.info(
-                        "FUZZY match found: '%s' -> '%s'",
-                        initiative_title,
-                        matched_initiative.title,
-                    )
-                else:
-                    logger.warning(
-                        "NO match found for initiative: '%s'. Available: %s",
-                        initiative_title,
-                        list(initiative_map.keys()),
-                    )
-                    continue
-
-            # Use the canonical initiative title from the matched initiative
-            canonical_title = matched_initiative.title
-
-            if canonical_title not in initiative_associations:
-                initiative_associations[canonical_title] = []
-
-            association = BacklogItemAssociation(
-                backlog_item=enriched_item.original_item,
-                confidence=enriched_item.initiative_confidence,
-                impact_analysis=enriched_item.impact_analysis,
-            )
-
-            initiative_associations[canonical_title].append(association)
-            logger.debug(
-                "Added association for initiative '%s' (total: %d)",
-                canonical_title,
-                len(initiative_associations[canonical_title]),
-            )
-        else:
+    # Apply the confidence threshold in a single pass so the grouping loop
+    # below only sees items that will be associated with an initiative
+    qualifying_items = [
+        enriched_item for enriched_item in enriched_items
+        if enriched_item.matched_initiative
+        and enriched_item.initiative_confidence >= confidence_threshold
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for enriched_item in enriched_items:
+            if enriched_item.matched_initiative and enriched_item.initiative_confidence >= confidence_threshold:
+                continue
             logger.debug(
                 "Item '%s' does not meet threshold: matched='%s', confidence=%d, threshold=%d",
                 enriched_item.original_item.title,
@@ -725,6 +1174,51 @@ def organize_backlog_by_initiative(
                 confidence_threshold,
             )
 
+    for enriched_item in qualifying_items:
+        initiative_title = enriched_item.matched_initiative
+        logger.debug(
+            "Item '%s' meets threshold - matched to initiative: '%s'",
+            enriched_item.original_item.title,
+            initiative_title,
+        )
+
+        # Try exact match first
+        matched_initiative = initiative_map.get(initiative_title)
+        if matched_initiative is not None:
+            logger.debug("EXACT match found for initiative: '%s'", initiative_title)
+        else:
+            # Try case-insensitive match
+            matched_initiative = initiative_map_folded.get(initiative_title.casefold().strip())
+            if matched_initiative is not None:
+                logger.info(
+                    "FUZZY match found: '%s' -> '%s'",
+                    initiative_title,
+                    matched_initiative.title,
+                )
+            else:
+                logger.warning(
+                    "NO match found for initiative: '%s'. Available: %s",
+                    initiative_title,
+                    list(initiative_map.keys()),
+                )
+                continue
+
+        # Use the canonical initiative title from the matched initiative
+        canonical_title = matched_initiative.title
+
+        association = BacklogItemAssociation(
+            backlog_item=enriched_item.original_item,
+            confidence=enriched_item.initiative_confidence,
+            impact_analysis=enriched_item.impact_analysis,
+        )
+
+        initiative_associations[canonical_title].append(association)
+        logger.debug(
+            "Added association for initiative '%s' (total: %d)",
+            canonical_title,
+            len(initiative_associations[canonical_title]),
+        )
+
     logger.info("Grouped items into %d initiatives: %s",
                 len(initiative_associations), list(initiative_associations.keys()))
 
@@ -755,6 +1249,12 @@ def organize_backlog_by_initiative(
     return reports
 
 
+# Getters used to aggregate associations without a Python-level loop body
+_get_association_category = attrgetter('backlog_item.category')
+_get_association_confidence = attrgetter('confidence')
+_get_relevance_score = attrgetter('relevance_score')
+
+
 def _generate_collective_impact_analysis(
     initiative: Initiative,
     associations: List[BacklogItemAssociation]
@@ -770,7 +1270,7 @@ def _generate_collective_impact_analysis(
     )
 
     # Analyze item categories
-    categories = {assoc.backlog_item.category for assoc in associations}
+    categories = set(map(_get_association_category, associations))
     if len(categories) > 1:
         impact_text += (
             f"These items span {len(categories)} different categories "
@@ -778,7 +1278,7 @@ def _generate_collective_impact_analysis(
         )
 
     # Analyze confidence levels
-    avg_confidence = sum(assoc.confidence for assoc in associations) / len(associations)
+    avg_confidence = sum(map(_get_association_confidence, associations)) / len(associations)
     if avg_confidence > 75:
         impact_text += "The high confidence scores indicate strong strategic alignment across all items."
     elif avg_confidence > 60:
@@ -808,6 +1308,49 @@ def _generate_strategic_recommendations(
     return recommendations
 
 
+def _write_report_file(file_path: Path, content: str) -> None:
+    """
+    Write a report file in one pass through a raw file descriptor.
+
+    The report is encoded once and written with os.write, skipping the
+    buffered text layer that open() sets up for each file.
+    """
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(file_path, _REPORT_OPEN_FLAGS, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _format_and_write_report(args: Tuple[InitiativeReport, Path]) -> Tuple[Path, Optional[str]]:
+    """
+    Generate and save the markdown report for a single initiative.
+
+    Defined at module level so it can run in a worker process. Errors are
+    returned rather than raised so one failed report does not stop the rest.
+
+    Args:
+        args: The initiative report and the directory to save it in
+
+    Returns:
+        Tuple[Path, Optional[str]]: The report path and the error message, or
+        None when the report was saved
+    """
+    report, output_path = args
+
+    # Generate filename from initiative title
+    file_path = output_path / sanitize_filename(f"{report.initiative.title}.md")
+
+    try:
+        _write_report_file(file_path, generate_initiative_markdown_report(report))
+    except Exception as e:
+        return file_path, str(e)
+
+    return file_path, None
+
+
 def save_initiative_reports(reports: List[InitiativeReport], output_dir: str) -> None:
     """
     Save initiative reports as markdown files.
@@ -827,28 +1370,30 @@ def save_initiative_reports(reports: List[InitiativeReport], output_dir: str) ->
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    saved_count = 0
-
-    for report in reports:
-        try:
-            # Generate filename from initiative title
-            filename = sanitize_filename(f"{report.initiative.title}.md")
-            file_path = output_path / filename
-
-            # Generate markdown content
-            markdown_content = generate_initiative_markdown_report(report)
+    save_args = [(report, output_path) for report in reports]
+
+    # Markdown generation is CPU-bound, so large report sets are formatted and
+    # written in worker processes rather than threads held back by the GIL.
+    # Smaller sets are dominated by file I/O, which releases the GIL, so they
+    # use threads and skip the process start-up cost.
+    if len(reports) >= _PARALLEL_REPORT_THRESHOLD and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_format_and_write_report, save_args, chunksize=4))
+    elif len(reports) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(reports), _MAX_REPORT_WRITER_THREADS)) as executor:
+            results = list(executor.map(_format_and_write_report, save_args))
+    else:
+        results = [_format_and_write_report(args) for args in save_args]
 
-            # Save to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+    saved_count = 0
 
+    for report, (file_path, error) in zip(reports, results):
+        if error is None:
             saved_count += 1
             logger.info("Saved initiative report: %s", file_path)
-
-        except Exception as e:
+        else:
             logger.error("Failed to save report for initiative '%s': %s",
-                        report.initiative.title, e)
-            continue
+                        report.initiative.title, error)
 
     print(f"✅ Saved {saved_count} initiative reports to {output_dir}")
     if saved_count < len(reports):
@@ -858,36 +1403,230 @@ def save_initiative_reports(reports: List[InitiativeReport], output_dir: str) ->
 def _analyze_item_centric(
     backlog_items: List[BacklogItem],
     initiatives: List[Initiative],
-    client: AzureOpenAI,
+    client: 'AzureOpenAI',
     model_name: str,
     confidence_threshold: int = 60,
-    additional_instructions: Optional[str] = None
+    additional_instructions: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    latency_optimized: bool = False
 ) -> List[EnrichedBacklogItem]:
     """
     Legacy item-centric processing mode - analyze each backlog item individually.
 
     This approach is less efficient for large datasets but maintained for compatibility.
-    Now uses structured outputs for more reliable parsing.
+    Now uses structured outputs for more reliable parsing. Items are analyzed
+    concurrently, up to _MAX_CONCURRENT_REQUESTS requests at a time.
 
     Args:
         additional_instructions: Optional additional instructions to include in the prompt
+        cache_dir: Optional directory for caching results, keyed by a hash of
+            the model and prompts, so unchanged items are not re-analyzed
+        latency_optimized: Request priority processing for each item request
     """
     logger.info("Starting legacy item-centric analysis for %d items using model: %s", len(backlog_items), model_name)
 
-    enriched_items: List[EnrichedBacklogItem] = []
+    # The system prompt is the same for every item, so it is built once and
+    # the same string is sent with each request. An initiative list too long
+    # for the prompt has its longest descriptions condensed first; the titles
+    # the model must answer with are unchanged
+    system_prompt = _build_item_centric_system_prompt(
+        _fit_item_centric_initiatives(client, initiatives, model_name, cache_dir), additional_instructions
+    )
 
-    # Prepare the initiative details for the LLM context
-    initiative_context = "\n".join([
-        f"- {initiative.title}: {initiative.description}"
-        for initiative in initiatives
-    ])
+    def analyze_item(indexed_item: Tuple[int, BacklogItem]) -> EnrichedBacklogItem:
+        i, item = indexed_item
+        return _analyze_single_item(
+            item, i, len(backlog_items), system_prompt, client, model_name, cache_dir, latency_optimized
+        )
 
-    for i, item in enumerate(backlog_items, 1):
+    # Each item is an independent request, so the requests are issued
+    # concurrently; map() keeps the results in backlog order
+    enriched_items: List[EnrichedBacklogItem] = []
+    # Report progress about every 5% of the backlog, but no more often than every 10 items
+    progress_interval = max(10, len(backlog_items) // 20)
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        for i, enriched_item in enumerate(executor.map(analyze_item, enumerate(backlog_items, 1)), 1):
+            enriched_items.append(enriched_item)
+
+            # Log progress
+            if i % progress_interval == 0:
+                logger.info("Processed %d/%d items", i, len(backlog_items))
+
+    logger.info("Completed legacy item-centric analysis of %d backlog items", len(enriched_items))
+    return enriched_items
+
+
+def _strict_json_schema(schema: Any) -> Any:
+    """
+    Return a copy of a pydantic JSON schema that meets the structured outputs strict mode rules.
+
+    Every object gets additionalProperties set to false and lists all of its
+    properties as required, and null defaults are dropped, the same changes
+    client.beta.chat.completions.parse makes to the schema it sends.
+
+    Args:
+        schema: A JSON schema, or any part of one
+
+    Returns:
+        The strict schema
+    """
+    if isinstance(schema, list):
+        return [_strict_json_schema(value) for value in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    strict_schema = {
+        key: _strict_json_schema(value)
+        for key, value in schema.items()
+        if not (key == 'default' and value is None)
+    }
+    if strict_schema.get('type') == 'object':
+        strict_schema['additionalProperties'] = False
+        if 'properties' in strict_schema:
+            strict_schema['required'] = list(strict_schema['properties'])
+    return strict_schema
+
+
+def _analyze_item_centric_batch(
+    backlog_items: List[BacklogItem],
+    initiatives: List[Initiative],
+    client: 'AzureOpenAI',
+    model_name: str,
+    additional_instructions: Optional[str] = None,
+    poll_interval: float = _BATCH_POLL_INTERVAL
+) -> List[EnrichedBacklogItem]:
+    """
+    Item-centric processing through the Batch API for offline runs.
+
+    Submits one request per backlog item as a single batch job, polls until
+    the job finishes and builds the enriched items from the output file.
+    Batch requests are billed at a discount but may take up to the 24 hour
+    completion window, and model_name must be a batch deployment. Items with
+    no successful result are returned as failed analyses.
+
+    Args:
+        backlog_items: Backlog items to analyze
+        initiatives: Initiatives to match the items against
+        client: Azure OpenAI client
+        model_name: Batch model deployment name
+        additional_instructions: Optional additional instructions to include in the prompt
+        poll_interval: Seconds to wait between batch status checks
+
+    Returns:
+        List[EnrichedBacklogItem]: One enriched item per backlog item, in backlog order
+
+    Raises:
+        RuntimeError: If the batch job fails, expires or is cancelled
+    """
+    from models import BacklogAnalysisResult
+
+    logger.info("Starting batch item-centric analysis for %d items using model: %s", len(backlog_items), model_name)
+
+    system_prompt = _build_item_centric_system_prompt(initiatives, additional_instructions)
+    # Strict schema, matching what client.beta.chat.completions.parse sends on
+    # the synchronous path, so batch responses are held to the same structure
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "BacklogAnalysisResult",
+            "schema": _strict_json_schema(BacklogAnalysisResult.model_json_schema()),
+            "strict": True
+        }
+    }
+
+    # One JSONL line per item; the custom_id is the item's index because
+    # backlog titles are not guaranteed to be unique
+    batch_input = b"".join(
+        _json_dumps({
+            "custom_id": f"item-{index}",
+            "method": "POST",
+            "url": "/chat/completions",
+            "body": {
+                "model": model_name,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": _build_item_centric_user_prompt(item)}
+                ],
+                "response_format": response_format,
+                "temperature": 0.1,
+                "max_tokens": 1000
+            }
+        }) + b"\n"
+        for index, item in enumerate(backlog_items)
+    )
+
+    input_file = client.files.create(file=("backlog_batch.jsonl", batch_input), purpose="batch")
+    batch = client.batches.create(input_file_id=input_file.id, endpoint="/chat/completions", completion_window="24h")
+    print(f"Submitted batch {batch.id} with {len(backlog_items)} requests, checking status every {poll_interval:g}s...")
+
+    while batch.status not in _BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        logger.info("Batch %s status: %s", batch.id, batch.status)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+    # Successful requests are written to the output file and requests that
+    # failed inside the batch to the error file; both use the same line format
+    results: Dict[int, EnrichedBacklogItem] = {}
+    output_text = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+    error_text = client.files.content(batch.error_file_id).text if batch.error_file_id else ""
+
+    for line in chain(output_text.splitlines(), error_text.splitlines()):
+        if not line.strip():
+            continue
         try:
-            logger.info("Analyzing item %d/%d: %s", i, len(backlog_items), item.title)
+            record = _json_loads(line)
+            index = int(record["custom_id"].split("-", 1)[1])
+            item = backlog_items[index]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            logger.warning("Skipping unrecognized batch output line: %s", e)
+            continue
+
+        try:
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                raise RuntimeError(record.get("error") or response.get("body"))
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[index] = _enriched_item_from_analysis(item, BacklogAnalysisResult.model_validate_json(content))
+        except Exception as e:
+            logger.error("Error analyzing item '%s': %s", item.title, e)
+            results[index] = _failed_enriched_item(item, str(e))
 
-            # Create the enhanced system prompt with additional instructions
-            system_prompt = f"""You are an expert business analyst tasked with categorizing software project backlog items into business initiatives.
+    enriched_items = [
+        results.get(index) or _failed_enriched_item(item, "no result returned by batch")
+        for index, item in enumerate(backlog_items)
+    ]
+
+    logger.info("Completed batch item-centric analysis of %d backlog items (%d with results)",
+                len(enriched_items), len(results))
+    return enriched_items
+
+
+def _render_item_centric_initiative_context(initiatives: List[Initiative]) -> str:
+    """Render the initiative list of the item-centric system prompt."""
+    return "\n".join([
+        f"- {initiative.title}: {initiative.description}"
+        for initiative in initiatives
+    ])
+
+
+def _build_item_centric_system_prompt(initiatives: List[Initiative], additional_instructions: Optional[str] = None) -> str:
+    """
+    Build the item-centric system prompt shared by every backlog item request.
+
+    Args:
+        initiatives: Initiatives listed in the prompt with their titles and descriptions
+        additional_instructions: Optional additional instructions to include in the prompt
+
+    Returns:
+        str: The system prompt
+    """
+    # Prepare the initiative details for the LLM context
+    initiative_context = _render_item_centric_initiative_context(initiatives)
+
+    system_prompt = f"""You are an expert business analyst tasked with categorizing software project backlog items into business initiatives.
 
 AVAILABLE INITIATIVES:
 {initiative_context}
@@ -908,120 +1647,174 @@ ANALYSIS GUIDELINES:
 - Evaluate category compatibility and resource requirements
 - If no initiative fits well, set primary_initiative to null and confidence scores below 50"""
 
-            # Add additional instructions if provided
-            if additional_instructions:
-                system_prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{additional_instructions}"
+    # Add additional instructions if provided
+    if additional_instructions:
+        system_prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{additional_instructions}"
 
-            system_prompt += "\n\nProvide your analysis in the structured format specified."
+    system_prompt += "\n\nProvide your analysis in the structured format specified."
 
-            user_prompt = f"""BACKLOG ITEM TO ANALYZE:
+    return system_prompt
+
+
+def _build_item_centric_user_prompt(item: BacklogItem) -> str:
+    """Build the item-centric user prompt for a single backlog item."""
+    return f"""BACKLOG ITEM TO ANALYZE:
 Title: {item.title}
 Goal: {item.goal}
 Category: {item.category}
 Stream: {item.stream}"""
 
-            # Use structured outputs with Pydantic model
-            completion = client.beta.chat.completions.parse(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format=BacklogAnalysisResult,
-                temperature=0.1,
-                max_tokens=1000
-            )
 
-            # Extract the parsed result
-            analysis_result = completion.choices[0].message.parsed
-
-            if analysis_result is None:
-                logger.error("Failed to parse structured output for item '%s'", item.title)
-                # Create a default analysis
-                analysis_result = BacklogAnalysisResult(
-                    primary_initiative=None,
-                    secondary_initiatives=[],
-                    category_confidence=0,
-                    initiative_confidence=0,
-                    impact_analysis="Failed to analyze due to parsing error",
-                    detailed_analysis="Structured output parsing failed",
-                    resource_implications="Not analyzed due to error",
-                    recommendations=[]
-                )
+def _enriched_item_from_analysis(item: BacklogItem, analysis_result: Any) -> EnrichedBacklogItem:
+    """Create an enriched backlog item from a BacklogAnalysisResult."""
+    return EnrichedBacklogItem(
+        original_item=item,
+        matched_initiative=analysis_result.primary_initiative,
+        secondary_initiatives=analysis_result.secondary_initiatives,
+        category_confidence=analysis_result.category_confidence,
+        initiative_confidence=analysis_result.initiative_confidence,
+        impact_analysis=analysis_result.impact_analysis,
+        detailed_analysis=analysis_result.detailed_analysis,
+        resource_implications=analysis_result.resource_implications,
+        recommendations=analysis_result.recommendations
+    )
 
-            # Create enriched backlog item
-            enriched_item = EnrichedBacklogItem(
-                original_item=item,
-                matched_initiative=analysis_result.primary_initiative,
-                secondary_initiatives=analysis_result.secondary_initiatives,
-                category_confidence=analysis_result.category_confidence,
-                initiative_confidence=analysis_result.initiative_confidence,
-                impact_analysis=analysis_result.impact_analysis,
-                detailed_analysis=analysis_result.detailed_analysis,
-                resource_implications=analysis_result.resource_implications,
-                recommendations=analysis_result.recommendations
-            )
 
-            enriched_items.append(enriched_item)
+def _unparsed_enriched_item(item: BacklogItem) -> EnrichedBacklogItem:
+    """
+    Create the default enriched item for a response whose structured output could not be parsed.
 
-            # Log progress
-            if i % 10 == 0:
-                logger.info("Processed %d/%d items", i, len(backlog_items))
+    The item is built directly rather than through a placeholder
+    BacklogAnalysisResult, so the failure path runs no model validation.
+    """
+    return EnrichedBacklogItem(
+        original_item=item,
+        matched_initiative=None,
+        secondary_initiatives=[],
+        category_confidence=0,
+        initiative_confidence=0,
+        impact_analysis="Failed to analyze due to parsing error",
+        detailed_analysis="Structured output parsing failed",
+        resource_implications="Not analyzed due to error",
+        recommendations=[]
+    )
 
-        except Exception as e:
-            logger.error("Error analyzing item '%s': %s", item.title, e)
-            # Create a default enriched item for failed analysis
-            enriched_item = EnrichedBacklogItem(
-                original_item=item,
-                matched_initiative=None,
-                secondary_initiatives=[],
-                category_confidence=0,
-                initiative_confidence=0,
-                impact_analysis=f"Analysis failed: {str(e)}",
-                detailed_analysis="Analysis failed",
-                resource_implications="Not analyzed due to error",
-                recommendations=[]
-            )
-            enriched_items.append(enriched_item)
 
-    logger.info("Completed legacy item-centric analysis of %d backlog items", len(enriched_items))
-    return enriched_items
+def _failed_enriched_item(item: BacklogItem, error: str) -> EnrichedBacklogItem:
+    """Create a default enriched item for a failed analysis."""
+    return EnrichedBacklogItem(
+        original_item=item,
+        matched_initiative=None,
+        secondary_initiatives=[],
+        category_confidence=0,
+        initiative_confidence=0,
+        impact_analysis=f"Analysis failed: {error}",
+        detailed_analysis="Analysis failed",
+        resource_implications="Not analyzed due to error",
+        recommendations=[]
+    )
+
+
+def _analyze_single_item(
+    item: BacklogItem,
+    item_number: int,
+    item_count: int,
+    system_prompt: str,
+    client: 'AzureOpenAI',
+    model_name: str,
+    cache_dir: Optional[str] = None,
+    latency_optimized: bool = False
+) -> EnrichedBacklogItem:
+    """
+    Analyze one backlog item against the initiatives for item-centric mode.
+
+    Failures are logged and returned as an unmatched EnrichedBacklogItem so
+    that one failed request does not stop the rest of the analysis. When
+    cache_dir is given, successful results are cached by a hash of the model
+    and prompts. latency_optimized requests priority processing.
+    """
+    from models import BacklogAnalysisResult
+
+    try:
+        logger.debug("Analyzing item %d/%d: %s", item_number, item_count, item.title)
+        user_prompt = _build_item_centric_user_prompt(item)
+
+        cache_key = None
+        if cache_dir:
+            cache_key = _analysis_cache_key(model_name, system_prompt, user_prompt)
+            cached_item = _load_cached_item_analysis(cache_dir, cache_key, item)
+            if cached_item is not None:
+                logger.debug("Using cached analysis for item '%s'", item.title)
+                return cached_item
+
+        # Use structured outputs with Pydantic model
+        completion = _ITEM_ANALYSIS_TOKENS.parse(
+            client,
+            model=model_name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format=BacklogAnalysisResult,
+            temperature=0.1,
+            **(_LATENCY_OPTIMIZED_OPTIONS if latency_optimized else {})
+        )
+
+        # Extract the parsed result
+        analysis_result = completion.choices[0].message.parsed
+
+        if analysis_result is None:
+            logger.error("Failed to parse structured output for item '%s'", item.title)
+            # Parsing failures are not cached so the item is retried next run
+            return _unparsed_enriched_item(item)
+
+        # Create enriched backlog item
+        enriched_item = _enriched_item_from_analysis(item, analysis_result)
+        if cache_key is not None:
+            _store_cached_item_analysis(cast(str, cache_dir), cache_key, enriched_item)
+        return enriched_item
+
+    except Exception as e:
+        logger.error("Error analyzing item '%s': %s", item.title, e)
+        # Create a default enriched item for failed analysis
+        return _failed_enriched_item(item, str(e))
 
 
 def _convert_associations_to_enriched_items(
     all_associations: List[InitiativeBacklogAssociation],
     confidence_threshold: int,
     initiatives: List[Initiative],
-    backlog_items: List[BacklogItem]
+    backlog_items: List[BacklogItem],
+    backlog_lookup: Optional[Dict[str, BacklogItem]] = None
 ) -> List[EnrichedBacklogItem]:
     """
     Convert InitiativeBacklogAssociation objects to EnrichedBacklogItem objects.
 
     For items with multiple associations, keeps the highest relevance score match.
+    The backlog_lookup title map is built from backlog_items when not supplied.
     """
     # Create lookup maps
-    backlog_lookup = {item.title: item for item in backlog_items}
+    if backlog_lookup is None:
+        backlog_lookup = build_backlog_lookup(backlog_items)
 
     # Group associations by backlog item title
-    item_associations: Dict[str, List[InitiativeBacklogAssociation]] = {}
+    item_associations: DefaultDict[str, List[InitiativeBacklogAssociation]] = defaultdict(list)
 
     for association in all_associations:
         if association.relevance_score >= confidence_threshold:
-            item_title = association.backlog_item_title
-            if item_title not in item_associations:
-                item_associations[item_title] = []
-            item_associations[item_title].append(association)
+            item_associations[association.backlog_item_title].append(association)
 
     # Convert to EnrichedBacklogItem objects
     enriched_items: List[EnrichedBacklogItem] = []
 
     logger.info("Converting %d unique backlog items with associations above threshold %d",
                len(item_associations), confidence_threshold)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     for item_title, associations in item_associations.items():
-        # Sort by relevance score and take the highest
-        associations.sort(key=lambda x: x.relevance_score, reverse=True)
-        best_association = associations[0]
+        # Take the highest relevance score; max() keeps the first of equal
+        # scores, matching the previous stable descending sort
+        best_association = max(associations, key=_get_relevance_score)
 
         # Find the actual backlog item
         backlog_item = backlog_lookup.get(item_title)
@@ -1032,11 +1825,17 @@ def _convert_associations_to_enriched_items(
         # We have the initiative title from the association
         matched_initiative_title = best_association.initiative_title
 
-        # Collect secondary initiatives from other high-confidence matches
-        secondary_initiatives = []
-        for assoc in associations[1:]:
-            if assoc.relevance_score >= confidence_threshold * 0.8:  # 80% of threshold
-                secondary_initiatives.append(assoc.initiative_title)
+        # Collect secondary initiatives from other high-confidence matches,
+        # highest score first; most items have a single association, so the
+        # remaining matches are only sorted when there are several
+        secondary_threshold = confidence_threshold * 0.8  # 80% of threshold
+        secondary_associations = [
+            assoc for assoc in associations
+            if assoc is not best_association and assoc.relevance_score >= secondary_threshold
+        ]
+        if len(secondary_associations) > 1:
+            secondary_associations.sort(key=_get_relevance_score, reverse=True)
+        secondary_initiatives = [assoc.initiative_title for assoc in secondary_associations]
 
         # Create enriched item with proper initiative title
         enriched_item = EnrichedBacklogItem(
@@ -1052,15 +1851,13 @@ def _convert_associations_to_enriched_items(
         )
 
         enriched_items.append(enriched_item)
-        logger.debug("Created enriched item for '%s' -> '%s' (confidence: %d)",
-                    item_title, matched_initiative_title, best_association.relevance_score)
 
-        # Additional debug logging to trace the issue
-        if matched_initiative_title:
-            logger.info("ENRICHED ITEM DEBUG: Item '%s' matched to initiative '%s' with confidence %d",
-                       item_title, matched_initiative_title, best_association.relevance_score)
-        else:
+        # Per-item tracing is only formatted when DEBUG logging is enabled
+        if not matched_initiative_title:
             logger.warning("ENRICHED ITEM DEBUG: Item '%s' has NO matched initiative", item_title)
+        elif debug_enabled:
+            logger.debug("Created enriched item for '%s' -> '%s' (confidence: %d)",
+                        item_title, matched_initiative_title, best_association.relevance_score)
 
     logger.info("Converted %d associations to %d enriched items", len(all_associations), len(enriched_items))
     return enriched_items
@@ -1069,46 +1866,90 @@ def _convert_associations_to_enriched_items(
 def _analyze_initiative_centric(
     backlog_items: List[BacklogItem],
     initiatives: List[Initiative],
-    client: AzureOpenAI,
+    client: 'AzureOpenAI',
     model_name: str,
     chunk_size: int,
-    confidence_threshold: int = 80
+    confidence_threshold: int = 80,
+    cache_dir: Optional[str] = None,
+    backlog_lookup: Optional[Dict[str, BacklogItem]] = None,
+    prescreen_model_name: Optional[str] = None,
+    latency_optimized: bool = False
 ) -> List[EnrichedBacklogItem]:
     """
     Initiative-centric processing mode - analyze batches of items for each initiative.
 
     This approach is more efficient and provides better LLM context for large datasets.
+    All initiative and chunk requests are issued concurrently, up to
+    _MAX_CONCURRENT_REQUESTS at a time. When cache_dir is given, results are
+    cached there and reused by later runs with identical prompts. When
+    prescreen_model_name is given, chunks that model judges irrelevant to an
+    initiative skip the structured analysis. latency_optimized requests
+    priority processing for the structured analysis requests.
     """
     logger.info("Starting initiative-centric analysis for %d items across %d initiatives using model: %s",
                 len(backlog_items), len(initiatives), model_name)
     logger.info("Using chunk size: %d", chunk_size)
 
-    # Process each initiative against chunks of backlog items
-    all_associations: List[InitiativeBacklogAssociation] = []
+    # Every (initiative, chunk) pair is an independent request, so they are all
+    # scheduled on one bounded pool; map() keeps the results in the original
+    # initiative and chunk order
+    # Chunk the items in order of prompt length so each request carries items
+    # of similar size; the chunks then finish in similar times and the
+    # per-chunk token budget is not set by a single long item
+    chunks = list(chunk_backlog_items(sorted(backlog_items, key=_backlog_item_text_length), chunk_size))
+    chunk_count = len(chunks)
+
+    # Verbose initiatives are condensed once here, rather than sending their
+    # full text with every chunk; the titles are kept exactly as they are
+    prompt_initiatives = _condense_initiatives(client, initiatives, model_name, cache_dir)
+    work = [
+        (initiative, chunk_idx, chunk)
+        for initiative in prompt_initiatives
+        for chunk_idx, chunk in enumerate(chunks, 1)
+    ]
+
+    def process_chunk(task: Tuple[Initiative, int, List[BacklogItem]]) -> List[InitiativeBacklogAssociation]:
+        initiative, chunk_idx, chunk = task
+        logger.info("Processing chunk %d/%d for initiative '%s' (%d items)",
+                   chunk_idx, chunk_count, initiative.title, len(chunk))
 
-    for initiative in initiatives:
-        logger.info("Processing initiative: %s", initiative.title)
+        try:
+            chunk_associations = process_initiative_chunk(
+                client, initiative, chunk, model_name, cache_dir, prescreen_model_name, latency_optimized
+            )
+            logger.info("Found %d relevant items in chunk %d", len(chunk_associations), chunk_idx)
+            return chunk_associations
 
-        # Chunk the backlog items for this initiative
-        chunks = chunk_backlog_items(backlog_items, chunk_size)
+        except Exception as e:
+            logger.error("Error processing chunk %d for initiative '%s': %s",
+                       chunk_idx, initiative.title, e)
+            return []
 
-        for chunk_idx, chunk in enumerate(chunks, 1):
-            logger.info("Processing chunk %d/%d for initiative '%s' (%d items)",
-                       chunk_idx, len(chunks), initiative.title, len(chunk))
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        chunk_results = list(executor.map(process_chunk, work))
 
-            try:
-                chunk_associations = process_initiative_chunk(client, initiative, chunk, model_name)
-                all_associations.extend(chunk_associations)
-                logger.info("Found %d relevant items in chunk %d", len(chunk_associations), chunk_idx)
+    # The chunks were formed in length order, so each initiative's associations
+    # are put back in backlog order; the aggregated items, their secondary
+    # initiatives and the report rows then keep the order they have when the
+    # chunks follow the backlog
+    item_positions: Dict[str, int] = {}
+    for position, item in enumerate(backlog_items):
+        item_positions.setdefault(item.title, position)
+    unknown_position = len(backlog_items)
 
-            except Exception as e:
-                logger.error("Error processing chunk %d for initiative '%s': %s",
-                           chunk_idx, initiative.title, e)
-                continue
+    all_associations: List[InitiativeBacklogAssociation] = []
+    for start in range(0, len(chunk_results), chunk_count or 1):
+        initiative_associations = list(chain.from_iterable(chunk_results[start:start + chunk_count]))
+        initiative_associations.sort(
+            key=lambda association: item_positions.get(association.backlog_item_title, unknown_position)
+        )
+        all_associations.extend(initiative_associations)
 
     # Aggregate and deduplicate associations
     logger.info("Aggregating %d total associations", len(all_associations))
-    enriched_items = _convert_associations_to_enriched_items(all_associations, confidence_threshold, initiatives, backlog_items)
+    enriched_items = _convert_associations_to_enriched_items(
+        all_associations, confidence_threshold, initiatives, backlog_items, backlog_lookup
+    )
 
     logger.info("Completed initiative-centric analysis: %d enriched items", len(enriched_items))
     return enriched_items
@@ -1118,7 +1959,7 @@ def analyze_initiative_associations(
     backlog_file: str,
     initiatives_file: str,
     output_dir: str,
-    client: AzureOpenAI,
+    client: 'AzureOpenAI',
     model_name: str,
     confidence_threshold: int = 60,
     backlog_title_filter: Optional[str] = None,
@@ -1140,12 +1981,20 @@ def analyze_initiative_associations(
         args: Command line arguments (optional, for processing mode)
     """
     try:
-        # Load data
-        print("Loading backlog items...")
-        backlog_items = load_backlog_items(backlog_file, backlog_title_filter)
-
-        print("Loading initiatives...")
-        initiatives = load_initiatives(initiatives_file, initiatives_title_filter)
+        # Compile the title filters up front so an invalid pattern is reported
+        # before either file is read; the loaders reuse the cached patterns
+        for title_filter in (backlog_title_filter, initiatives_title_filter):
+            if title_filter:
+                _compile_title_filter(title_filter)
+
+        # Load data; the two files are independent, so they are read concurrently
+        # (the PyArrow CSV reader releases the GIL while parsing)
+        print("Loading backlog items and initiatives...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backlog_future = executor.submit(load_backlog_items, backlog_file, backlog_title_filter)
+            initiatives_future = executor.submit(load_initiatives, initiatives_file, initiatives_title_filter)
+            backlog_items = backlog_future.result()
+            initiatives = initiatives_future.result()
 
         if not backlog_items:
             print("No backlog items found. Please check your backlog CSV file.")
@@ -1155,6 +2004,10 @@ def analyze_initiative_associations(
             print("No initiatives found. Please check your initiatives CSV file.")
             return
 
+        # Index the backlog by title once for every stage that maps model
+        # output back to backlog items
+        backlog_lookup = build_backlog_lookup(backlog_items)
+
         print(f"Analyzing {len(backlog_items)} backlog items against {len(initiatives)} initiatives...")
         print(f"Using confidence threshold: {confidence_threshold}%")
 
@@ -1164,39 +2017,63 @@ def analyze_initiative_associations(
             processing_mode = args.processing_mode
             print(f"Using processing mode: {processing_mode}")
 
+        cache_dir = None
+        if args and not getattr(args, 'no_cache', False):
+            cache_dir = getattr(args, 'cache_dir', None)
+        latency_optimized = bool(getattr(args, 'latency_optimized', False)) if args else False
+        if latency_optimized and processing_mode != 'item-centric-batch':
+            print("Requesting priority processing for analysis calls")
+
         # Process items based on mode
         if processing_mode == 'item-centric':
             print("⚠️  Using legacy item-centric mode - less efficient for large datasets")
             additional_instructions = getattr(args, 'additional_instructions', None) if args else None
-            enriched_items = _analyze_item_centric(backlog_items, initiatives, client, model_name, confidence_threshold, additional_instructions)
+            if cache_dir:
+                print(f"Caching analysis results in: {cache_dir}")
+            enriched_items = _analyze_item_centric(
+                backlog_items, initiatives, client, model_name, confidence_threshold, additional_instructions, cache_dir,
+                latency_optimized
+            )
+        elif processing_mode == 'item-centric-batch':
+            print("Using item-centric batch mode - results are returned when the batch job completes")
+            additional_instructions = getattr(args, 'additional_instructions', None) if args else None
+            enriched_items = _analyze_item_centric_batch(backlog_items, initiatives, client, model_name, additional_instructions)
         else:
             chunk_size = 20  # Default
             if args and hasattr(args, 'chunk_size'):
                 chunk_size = args.chunk_size
             print(f"Using initiative-centric mode with chunk size: {chunk_size}")
-            enriched_items = _analyze_initiative_centric(backlog_items, initiatives, client, model_name, chunk_size, confidence_threshold)
-
-        qualifying_items = 0
-        qualifying_items_debug = []  # Track which items qualify for debugging
-        for item in enriched_items:
-            if (item.matched_initiative and
-                item.initiative_confidence >= confidence_threshold):
-                qualifying_items += 1
-                qualifying_items_debug.append({
-                    'title': item.original_item.title,
-                    'matched_initiative': item.matched_initiative,
-                    'confidence': item.initiative_confidence
-                })
+            if cache_dir:
+                print(f"Caching analysis results in: {cache_dir}")
+            prescreen_model_name = getattr(args, 'prescreen_model', None) if args else None
+            if prescreen_model_name:
+                print(f"Prescreening chunks with model: {prescreen_model_name}")
+            enriched_items = _analyze_initiative_centric(
+                backlog_items, initiatives, client, model_name, chunk_size, confidence_threshold, cache_dir,
+                backlog_lookup, prescreen_model_name, latency_optimized
+            )
+
+        if cache_dir:
+            _prune_cache_dir(cache_dir)
+
+        # Select the items that meet the threshold in one pass; the same list
+        # feeds the summary and the report generation below
+        qualifying = [
+            item for item in enriched_items
+            if item.matched_initiative and item.initiative_confidence >= confidence_threshold
+        ]
+        qualifying_items = len(qualifying)
 
         # Debug logging to show what items qualify and their initiative titles
-        logger.info("DEBUG: Qualifying items summary (showing first 5):")
-        unique_initiatives = set()
-        for debug_item in qualifying_items_debug[:5]:  # Show first 5 for debugging
-            logger.info("  - Item '%s' -> Initiative '%s' (confidence: %d)",
-                       debug_item['title'], debug_item['matched_initiative'], debug_item['confidence'])
-            unique_initiatives.add(debug_item['matched_initiative'])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Qualifying items summary (showing first 5):")
+            unique_initiatives = set()
+            for item in qualifying[:5]:  # Show first 5 for debugging
+                logger.debug("  - Item '%s' -> Initiative '%s' (confidence: %d)",
+                            item.original_item.title, item.matched_initiative, item.initiative_confidence)
+                unique_initiatives.add(item.matched_initiative)
 
-        logger.info("DEBUG: Unique AI-generated initiative titles: %s", list(unique_initiatives))
+            logger.debug("Unique AI-generated initiative titles: %s", list(unique_initiatives))
 
         print("\n📊 Analysis Summary:")
         print(f"   • Total items analyzed: {len(enriched_items)}")
@@ -1206,7 +2083,7 @@ def analyze_initiative_associations(
         # Generate initiative reports
         if enriched_items:
             print("\n📝 Generating initiative reports...")
-            reports = organize_backlog_by_initiative(enriched_items, initiatives, confidence_threshold)
+            reports = organize_backlog_by_initiative(qualifying, initiatives, confidence_threshold)
 
             if reports:
                 print(f"Generated {len(reports)} initiative reports")
@@ -1312,11 +2189,49 @@ def get_initiative_analysis_system_prompt() -> str:
 Remember: Your goal is to help organizations maximize initiative success by identifying the most strategically valuable backlog items for each initiative."""
 
 
+@lru_cache(maxsize=1024)
+def _build_initiative_relevance_system_prompt(initiative_fields: Tuple[str, ...]) -> str:
+    """
+    Build the system prompt for analyzing backlog chunks against one initiative.
+
+    Everything that stays the same across the chunks of an initiative (the
+    analyzer role, the initiative context and the analysis focus) goes in the
+    system prompt, so each request for the initiative starts with a
+    byte-identical prefix that the service can serve from its prompt cache.
+    Only the backlog items go in the user prompt.
+
+    Args:
+        initiative_fields: Initiative field values in _INITIATIVE_FIELDS order
+    """
+    area, title, details, description, kpi, current_state, solutions = initiative_fields
+    return f"""{get_initiative_analysis_system_prompt()}
+
+INITIATIVE CONTEXT:
+- Area: {area}
+- Title: {title}
+- Details: {details}
+- Description: {description}
+- KPIs: {kpi}
+- Current State: {current_state}
+- Proposed Solutions: {solutions}
+
+For each backlog item, determine its relevance to this specific initiative. Only include items with relevance scores of 40 or higher.
+
+Focus on:
+1. Direct alignment between backlog item goals and initiative objectives
+2. How completion of the backlog item advances the initiative's KPIs
+3. Strategic fit within the initiative's area and proposed solutions
+4. Implementation timing and resource synergies"""
+
+
 def analyze_initiative_relevance(
-    client: AzureOpenAI,
+    client: 'AzureOpenAI',
     initiative: Initiative,
     backlog_items: List[BacklogItem],
-    model_name: str
+    model_name: str,
+    cache_dir: Optional[str] = None,
+    prescreen_model_name: Optional[str] = None,
+    latency_optimized: bool = False
 ) -> List[InitiativeBacklogAssociation]:
     """
     Analyze a chunk of backlog items for relevance to a specific initiative using structured outputs.
@@ -1326,6 +2241,12 @@ def analyze_initiative_relevance(
         initiative: The initiative to analyze against
         backlog_items: List of backlog items to evaluate
         model_name: Model deployment name
+        cache_dir: Optional directory for caching results, keyed by a hash of
+            the model name and prompts, so re-runs skip unchanged requests
+        prescreen_model_name: Optional cheaper model deployment asked first
+            whether any item in the chunk relates to the initiative; the
+            structured analysis is skipped when it answers no
+        latency_optimized: Request priority processing for the structured analysis
 
     Returns:
         List of InitiativeBacklogAssociation objects for relevant items
@@ -1333,51 +2254,57 @@ def analyze_initiative_relevance(
     Raises:
         RuntimeError: If the AI analysis fails
     """
-    try:
-        # Create system prompt for initiative-centric analysis
-        system_prompt = get_initiative_analysis_system_prompt()
+    from models import InitiativeRelevanceResult
 
-        # Format backlog items for analysis
-        backlog_text = ""
-        for i, item in enumerate(backlog_items, 1):
-            backlog_text += f"""
+    try:
+        # Create system prompt for initiative-centric analysis; it is cached
+        # per initiative and shared by every chunk analyzed against it
+        system_prompt = _build_initiative_relevance_system_prompt(_get_initiative_fields(initiative))
+
+        # Format backlog items for analysis, joining once rather than
+        # growing the string item by item
+        backlog_text = "".join(
+            f"""
 Item {i}:
 - Title: {item.title}
 - Category: {item.category}
 - Goal: {item.goal}
 - Stream: {item.stream}
 """
+            for i, item in enumerate(backlog_items, 1)
+        )
 
         # Create user prompt for initiative-focused analysis
         user_prompt = f"""
-Analyze these {len(backlog_items)} backlog items for their relevance to the following initiative:
-
-INITIATIVE CONTEXT:
-- Area: {initiative.area}
-- Title: {initiative.title}
-- Details: {initiative.details}
-- Description: {initiative.description}
-- KPIs: {initiative.kpi}
-- Current State: {initiative.current_state}
-- Proposed Solutions: {initiative.solutions}
+Analyze these {len(backlog_items)} backlog items for their relevance to the initiative:
 
 BACKLOG ITEMS TO ANALYZE:
 {backlog_text}
-
-For each backlog item, determine its relevance to this specific initiative. Only include items with relevance scores of 40 or higher.
-
-Focus on:
-1. Direct alignment between backlog item goals and initiative objectives
-2. How completion of the backlog item advances the initiative's KPIs
-3. Strategic fit within the initiative's area and proposed solutions
-4. Implementation timing and resource synergies
 """
 
+        cache_key = None
+        if cache_dir:
+            cache_key = _analysis_cache_key(model_name, system_prompt, user_prompt)
+            cached_associations = _load_cached_associations(cache_dir, cache_key)
+            if cached_associations is not None:
+                logger.info("Using %d cached relevant items for initiative '%s'",
+                           len(cached_associations), initiative.title)
+                return cached_associations
+
+        if prescreen_model_name and not _prescreen_initiative_chunk(
+            client, initiative, backlog_items, prescreen_model_name
+        ):
+            logger.info("Prescreen found no relevant items for initiative '%s'; skipping analysis",
+                       initiative.title)
+            return []
+
         logger.info("Analyzing %d backlog items for initiative '%s' using model: %s with structured outputs",
                    len(backlog_items), initiative.title, model_name)
 
         # Use structured outputs with Pydantic model
-        completion = client.beta.chat.completions.parse(
+        completion = _RELEVANCE_ANALYSIS_TOKENS.parse(
+            client,
+            len(backlog_items),
             model=model_name,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -1385,7 +2312,7 @@ Focus on:
             ],
             response_format=InitiativeRelevanceResult,
             temperature=0.1,
-            max_tokens=2000
+            **(_LATENCY_OPTIMIZED_OPTIONS if latency_optimized else {})
         )
 
         # Extract the parsed result
@@ -1415,6 +2342,10 @@ Focus on:
                 continue
 
         logger.info("Found %d relevant items for initiative '%s'", len(associations), initiative.title)
+
+        if cache_key is not None:
+            _store_cached_associations(cast(str, cache_dir), cache_key, associations)
+
         return associations
 
     except Exception as e:
@@ -1422,11 +2353,60 @@ Focus on:
         raise RuntimeError(f"Unable to analyze initiative relevance: {e}") from e
 
 
+def _prescreen_initiative_chunk(
+    client: 'AzureOpenAI',
+    initiative: Initiative,
+    backlog_items: List[BacklogItem],
+    model_name: str
+) -> bool:
+    """
+    Ask a cheap model whether any backlog item in a chunk relates to an initiative.
+
+    The prompt and answer are kept as short as possible so the check costs far
+    less than the structured analysis it can save. Errors and unclear answers
+    count as a yes, so the prescreen can only skip work, never lose results.
+
+    Args:
+        client: Azure OpenAI client
+        initiative: The initiative to check against
+        backlog_items: The chunk of backlog items to check
+        model_name: Model deployment name used for the prescreen
+
+    Returns:
+        bool: False only if the model answered no
+    """
+    items_text = "\n".join(f"- {item.title}: {item.goal}" for item in backlog_items)
+    user_prompt = f"""Initiative: {initiative.title} - {initiative.description}
+
+Backlog items:
+{items_text}
+
+Do any of these backlog items relate to the initiative?"""
+
+    try:
+        completion = client.chat.completions.create(
+            model=model_name,
+            messages=[
+                {"role": "system", "content": "Reply only YES or NO."},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0,
+            max_tokens=3
+        )
+        answer = completion.choices[0].message.content or ""
+    except Exception as e:
+        logger.warning("Prescreen failed for initiative '%s', running full analysis: %s", initiative.title, e)
+        return True
+
+    return not answer.strip().upper().startswith("NO")
+
+
 def aggregate_initiative_associations(
     initiative: Initiative,
     association_batches: List[List[InitiativeBacklogAssociation]],
     backlog_items: List[BacklogItem],
-    confidence_threshold: int = 60
+    confidence_threshold: int = 60,
+    backlog_lookup: Optional[Dict[str, BacklogItem]] = None
 ) -> List[BacklogItemAssociation]:
     """
     Aggregate and deduplicate association results from multiple chunks.
@@ -1436,43 +2416,44 @@ def aggregate_initiative_associations(
         association_batches: List of association lists from different chunks
         backlog_items: Original backlog items for lookup
         confidence_threshold: Minimum confidence for inclusion
+        backlog_lookup: Optional precomputed title to backlog item map, so
+            callers aggregating many initiatives build it only once
 
     Returns:
         List of BacklogItemAssociation objects above threshold
     """
     # Create lookup map for backlog items by title
-    backlog_lookup = {item.title: item for item in backlog_items}
+    if backlog_lookup is None:
+        backlog_lookup = build_backlog_lookup(backlog_items)
 
-    # Collect all associations and deduplicate by title
+    # Collect all associations and deduplicate by title in a single pass,
+    # keeping the highest scoring association if duplicates exist
     association_map: Dict[str, InitiativeBacklogAssociation] = {}
 
-    for batch in association_batches:
-        for association in batch:
-            title = association.backlog_item_title
-
-            # Keep highest scoring association if duplicates exist
-            if title in association_map:
-                if association.relevance_score > association_map[title].relevance_score:
-                    association_map[title] = association
-            else:
-                association_map[title] = association
+    for association in chain.from_iterable(association_batches):
+        title = association.backlog_item_title
+        current = association_map.get(title)
+        if current is None or association.relevance_score > current.relevance_score:
+            association_map[title] = association
 
     # Filter by confidence threshold and convert to BacklogItemAssociation
     result_associations = []
 
     for title, association in association_map.items():
-        if association.relevance_score >= confidence_threshold:
-            # Find matching backlog item
-            backlog_item = backlog_lookup.get(title)
-            if backlog_item:
-                backlog_association = association.to_backlog_item_association(backlog_item)
-                result_associations.append(backlog_association)
-            else:
-                logger.warning("Could not find backlog item '%s' for initiative '%s'",
-                             title, initiative.title)
+        if association.relevance_score < confidence_threshold:
+            continue
+
+        # Find matching backlog item
+        backlog_item = backlog_lookup.get(title)
+        if backlog_item is None:
+            logger.warning("Could not find backlog item '%s' for initiative '%s'",
+                         title, initiative.title)
+            continue
+
+        result_associations.append(association.to_backlog_item_association(backlog_item))
 
     # Sort by confidence score descending
-    result_associations.sort(key=lambda x: x.confidence, reverse=True)
+    result_associations.sort(key=_get_association_confidence, reverse=True)
 
     logger.info("Aggregated %d associations for initiative '%s' (threshold: %d)",
                len(result_associations), initiative.title, confidence_threshold)
@@ -1480,11 +2461,314 @@ def aggregate_initiative_associations(
     return result_associations
 
 
+def condense_initiative(
+    client: 'AzureOpenAI',
+    initiative: Initiative,
+    model_name: str,
+    cache_dir: Optional[str] = None
+) -> Initiative:
+    """
+    Condense the free-text fields of a verbose initiative for use in prompts.
+
+    Initiatives whose details, description, current state and solutions are
+    short enough are returned unchanged. Longer ones are condensed once by the
+    model, keeping the area, title and KPIs verbatim, and the result is cached
+    for the rest of the run. If condensing fails the original initiative is
+    returned, and condensing is tried again on the next call.
+
+    When cache_dir is given, a successfully condensed initiative is also stored
+    there, keyed by a hash of the original fields and the model, and reused by
+    later runs. The condensed text is part of every analysis prompt, so reusing
+    it keeps the analysis cache keys unchanged between runs.
+
+    Args:
+        client: Azure OpenAI client
+        initiative: The initiative to condense
+        model_name: Model deployment name
+        cache_dir: Optional directory for caching condensed initiatives
+
+    Returns:
+        Initiative: The condensed initiative, or the original one
+    """
+    text_length = (len(initiative.details) + len(initiative.description)
+                   + len(initiative.current_state) + len(initiative.solutions))
+    if text_length <= _INITIATIVE_CONDENSE_THRESHOLD:
+        return initiative
+
+    cache_key = (_get_initiative_fields(initiative), model_name)
+    condensed = _condensed_initiatives.get(cache_key)
+    if condensed is not None:
+        return condensed
+
+    disk_cache_key = None
+    if cache_dir:
+        disk_cache_key = _condensed_initiative_cache_key(*cache_key)
+        condensed = _load_cached_condensed_initiative(cache_dir, disk_cache_key)
+        if condensed is not None:
+            logger.debug("Using cached condensed initiative '%s'", initiative.title)
+
+    if condensed is None:
+        condensed = _condense_initiative_fields(client, cache_key[0], model_name)
+        if condensed is None:
+            # Failures are often transient, so the full text is used for this
+            # call only and is neither memoized nor stored
+            return initiative
+        if disk_cache_key is not None:
+            _write_cache_entry(cast(str, cache_dir), disk_cache_key, condensed.to_dict())
+
+    _condensed_initiatives[cache_key] = condensed
+    return condensed
+
+
+def _condense_initiatives(
+    client: 'AzureOpenAI',
+    initiatives: List[Initiative],
+    model_name: str,
+    cache_dir: Optional[str] = None
+) -> List[Initiative]:
+    """
+    Condense every verbose initiative, in order, with the requests issued concurrently.
+
+    Args:
+        client: Azure OpenAI client
+        initiatives: The initiatives to condense
+        model_name: Model deployment name
+        cache_dir: Optional directory for caching condensed initiatives
+
+    Returns:
+        List[Initiative]: The initiatives to use in prompts, in the original order
+    """
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        return list(executor.map(
+            lambda initiative: condense_initiative(client, initiative, model_name, cache_dir), initiatives
+        ))
+
+
+def _condense_initiative_fields(
+    client: 'AzureOpenAI',
+    initiative_fields: Tuple[str, ...],
+    model_name: str
+) -> Optional[Initiative]:
+    """Ask the model to condense an initiative given its field values, returning None if it fails."""
+    from models import CondensedInitiative
+
+    area, title, details, description, kpi, current_state, solutions = initiative_fields
+    try:
+        completion = client.beta.chat.completions.parse(
+            model=model_name,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Condense each field of the initiative to at most a few sentences, keeping every "
+                               "goal, KPI, constraint and proposed solution that matters for judging which work "
+                               "items advance it. Do not add information."
+                },
+                {
+                    "role": "user",
+                    "content": f"""Initiative: {title}
+Area: {area}
+KPIs: {kpi}
+
+Details: {details}
+
+Description: {description}
+
+Current State: {current_state}
+
+Solutions: {solutions}"""
+                }
+            ],
+            response_format=CondensedInitiative,
+            temperature=0,
+            max_tokens=600
+        )
+        condensed = completion.choices[0].message.parsed
+    except Exception as e:
+        logger.warning("Failed to condense initiative '%s', using full text: %s", title, e)
+        condensed = None
+
+    if condensed is None:
+        return None
+
+    logger.info("Condensed initiative '%s' from %d to %d characters", title,
+                len(details) + len(description) + len(current_state) + len(solutions),
+                len(condensed.details) + len(condensed.description)
+                + len(condensed.current_state) + len(condensed.solutions))
+
+    return Initiative(
+        area=area,
+        title=title,
+        details=condensed.details,
+        description=condensed.description,
+        kpi=kpi,
+        current_state=condensed.current_state,
+        solutions=condensed.solutions
+    )
+
+
+def _fit_item_centric_initiatives(
+    client: 'AzureOpenAI',
+    initiatives: List[Initiative],
+    model_name: str,
+    cache_dir: Optional[str] = None
+) -> List[Initiative]:
+    """
+    Keep the item-centric initiative list within _ITEM_CENTRIC_CONTEXT_LIMIT.
+
+    The item-centric system prompt lists only the title and description of
+    each initiative. When that list fits within the limit the initiatives are
+    returned unchanged. Otherwise every description longer than an even share
+    of the limit is condensed to that share, with the requests issued
+    concurrently.
+
+    Args:
+        client: Azure OpenAI client
+        initiatives: The initiatives listed in the prompt
+        model_name: Model deployment name
+        cache_dir: Optional directory for caching condensed descriptions
+
+    Returns:
+        List[Initiative]: The initiatives to use in the prompt, in the original order
+    """
+    context_length = len(_render_item_centric_initiative_context(initiatives))
+    if context_length <= _ITEM_CENTRIC_CONTEXT_LIMIT:
+        return initiatives
+
+    max_length = _ITEM_CENTRIC_CONTEXT_LIMIT // len(initiatives)
+    logger.info("Item-centric initiative list is %d characters, over the %d limit; "
+                "condensing descriptions longer than %d characters",
+                context_length, _ITEM_CENTRIC_CONTEXT_LIMIT, max_length)
+
+    def fit_initiative(initiative: Initiative) -> Initiative:
+        if len(initiative.description) <= max_length:
+            return initiative
+        description = condense_initiative_description(client, initiative, model_name, max_length, cache_dir)
+        return replace(initiative, description=description)
+
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        fitted_initiatives = list(executor.map(fit_initiative, initiatives))
+
+    fitted_length = len(_render_item_centric_initiative_context(fitted_initiatives))
+    if fitted_length > _ITEM_CENTRIC_CONTEXT_LIMIT:
+        logger.warning("Item-centric initiative list is still %d characters after condensing, over the %d limit",
+                       fitted_length, _ITEM_CENTRIC_CONTEXT_LIMIT)
+    return fitted_initiatives
+
+
+def condense_initiative_description(
+    client: 'AzureOpenAI',
+    initiative: Initiative,
+    model_name: str,
+    max_length: int,
+    cache_dir: Optional[str] = None
+) -> str:
+    """
+    Condense an initiative description for the item-centric system prompt.
+
+    Successful results are cached for the rest of the run and, when cache_dir
+    is given, stored there for later runs, keyed by a hash of the title,
+    description, model and maximum length. If condensing fails the original
+    description is returned and condensing is tried again on the next call.
+
+    Args:
+        client: Azure OpenAI client
+        initiative: The initiative whose description is condensed
+        model_name: Model deployment name
+        max_length: Maximum length of the condensed description in characters
+        cache_dir: Optional directory for caching condensed descriptions
+
+    Returns:
+        str: The condensed description, or the original one
+    """
+    cache_key = (initiative.title, initiative.description, model_name, max_length)
+    condensed = _condensed_descriptions.get(cache_key)
+    if condensed is not None:
+        return condensed
+
+    disk_cache_key = None
+    if cache_dir:
+        disk_cache_key = hashlib.sha256(_json_dumps({
+            "model": model_name, "condense_description": list(cache_key[:2]), "max_length": max_length
+        })).hexdigest()
+        condensed = _load_cached_condensed_description(cache_dir, disk_cache_key)
+
+    if condensed is None:
+        condensed = _condense_description(client, initiative, model_name, max_length)
+        if condensed is None:
+            return initiative.description
+        if disk_cache_key is not None:
+            _write_cache_entry(cast(str, cache_dir), disk_cache_key, {"description": condensed})
+
+    _condensed_descriptions[cache_key] = condensed
+    return condensed
+
+
+def _load_cached_condensed_description(cache_dir: str, key: str) -> Optional[str]:
+    """
+    Load a cached condensed initiative description.
+
+    Returns:
+        The cached description, or None if there is no usable cache entry
+    """
+    try:
+        return str(_json_loads(_read_cache_entry(cache_dir, key))["description"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+        return None
+
+
+def _condense_description(
+    client: 'AzureOpenAI',
+    initiative: Initiative,
+    model_name: str,
+    max_length: int
+) -> Optional[str]:
+    """Ask the model to condense an initiative description, returning None if it fails."""
+    from models import CondensedDescription
+
+    try:
+        completion = client.beta.chat.completions.parse(
+            model=model_name,
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"Condense the initiative description to at most {max_length} characters, keeping "
+                               "every goal and objective that matters for judging which work items advance the "
+                               "initiative. Do not add information."
+                },
+                {
+                    "role": "user",
+                    "content": f"Initiative: {initiative.title}\n\nDescription: {initiative.description}"
+                }
+            ],
+            response_format=CondensedDescription,
+            temperature=0,
+            max_tokens=max(256, max_length // 2)
+        )
+        condensed = completion.choices[0].message.parsed
+    except Exception as e:
+        logger.warning("Failed to condense the description of initiative '%s', using full text: %s",
+                       initiative.title, e)
+        return None
+
+    if condensed is None:
+        return None
+
+    logger.info("Condensed description of initiative '%s' from %d to %d characters",
+                initiative.title, len(initiative.description), len(condensed.description))
+    return condensed.description
+
+
 def process_initiative_chunk(
-    client: AzureOpenAI,
+    client: 'AzureOpenAI',
     initiative: Initiative,
     backlog_chunk: List[BacklogItem],
-    model_name: str
+    model_name: str,
+    cache_dir: Optional[str] = None,
+    prescreen_model_name: Optional[str] = None,
+    latency_optimized: bool = False
 ) -> List[InitiativeBacklogAssociation]:
     """
     Process a single chunk of backlog items for a specific initiative.
@@ -1496,12 +2780,17 @@ def process_initiative_chunk(
         initiative: The initiative to analyze against
         backlog_chunk: Chunk of backlog items to process
         model_name: Model deployment name
+        cache_dir: Optional directory for caching analysis results
+        prescreen_model_name: Optional cheaper model used to skip chunks with no relevant items
+        latency_optimized: Request priority processing for the analysis
 
     Returns:
         List of InitiativeBacklogAssociation objects for relevant items
     """
     try:
-        associations = analyze_initiative_relevance(client, initiative, backlog_chunk, model_name)
+        associations = analyze_initiative_relevance(
+            client, initiative, backlog_chunk, model_name, cache_dir, prescreen_model_name, latency_optimized
+        )
         logger.debug("Processed chunk of %d items for initiative '%s', found %d associations",
                     len(backlog_chunk), initiative.title, len(associations))
         return associations
@@ -1511,41 +2800,18 @@ def process_initiative_chunk(
         return []
 
 
-def analyze_backlog_item(
-    client: AzureOpenAI,
-    backlog_item: BacklogItem,
-    initiatives: List[Initiative],
-    model_name: str,
-    additional_instructions: Optional[str] = None
-) -> EnrichedBacklogItem:
+def format_initiatives_text(initiatives: List[Initiative]) -> str:
     """
-    Analyze a single backlog item against available initiatives using AI with structured outputs.
+    Render initiatives in the format used by the analyze_backlog_item prompt.
 
     Args:
-        client: The Azure OpenAI client
-        backlog_item: The backlog item to analyze
-        initiatives: List of available initiatives
-        model_name: The model deployment name
-        additional_instructions: Optional additional instructions to include in the prompt
+        initiatives: List of initiatives to render
 
     Returns:
-        EnrichedBacklogItem with AI analysis results
-
-    Raises:
-        RuntimeError: If the AI analysis fails
+        str: The initiatives block for the user prompt
     """
-    try:
-        # Create enhanced system prompt with additional instructions
-        system_prompt = get_backlog_analysis_system_prompt()
-
-        # Add additional instructions if provided
-        if additional_instructions:
-            system_prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{additional_instructions}"
-
-        # Format initiatives for analysis
-        initiatives_text = ""
-        for i, initiative in enumerate(initiatives, 1):
-            initiatives_text += f"""
+    return "".join(
+        f"""
 Initiative {i}:
 - Area: {initiative.area}
 - Title: {initiative.title}
@@ -1555,16 +2821,33 @@ Initiative {i}:
 - Current State: {initiative.current_state}
 - Solutions: {initiative.solutions}
 """
+        for i, initiative in enumerate(initiatives, 1)
+    )
 
-        # Create user prompt for analysis
-        user_prompt = f"""
-Analyze this backlog item against the provided initiatives:
 
-BACKLOG ITEM:
-- Category: {backlog_item.category}
-- Title: {backlog_item.title}
-- Goal: {backlog_item.goal}
-- Stream: {backlog_item.stream}
+@lru_cache(maxsize=32)
+def _build_backlog_analysis_system_prompt(initiatives_text: str, additional_instructions: Optional[str]) -> str:
+    """
+    Build the analyze_backlog_item system prompt for a set of initiatives.
+
+    Everything that stays the same across backlog items (the analyzer role,
+    any additional instructions, the initiatives and the scoring guidance) goes
+    in the system prompt, so every request starts with a byte-identical prefix
+    that the service can serve from its prompt cache.
+
+    Args:
+        initiatives_text: Initiatives rendered by format_initiatives_text
+        additional_instructions: Optional additional instructions to include in the prompt
+    """
+    system_prompt = get_backlog_analysis_system_prompt()
+
+    # Add additional instructions if provided
+    if additional_instructions:
+        system_prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{additional_instructions}"
+
+    return f"""{system_prompt}
+
+Analyze each backlog item you are given against the provided initiatives.
 
 AVAILABLE INITIATIVES:
 {initiatives_text}
@@ -1579,20 +2862,64 @@ Provide confidence scores:
 - category_confidence: 0-100 (how well the category aligns with initiative areas)
 - initiative_confidence: 0-100 (strength of association with primary initiative)
 
-Only suggest a primary_initiative if confidence is above 40. Use null if no good match exists.
-"""
+Only suggest a primary_initiative if confidence is above 40. Use null if no good match exists."""
+
+
+def analyze_backlog_item(
+    client: 'AzureOpenAI',
+    backlog_item: BacklogItem,
+    initiatives: List[Initiative],
+    model_name: str,
+    additional_instructions: Optional[str] = None,
+    initiatives_text: Optional[str] = None
+) -> EnrichedBacklogItem:
+    """
+    Analyze a single backlog item against available initiatives using AI with structured outputs.
+
+    Args:
+        client: The Azure OpenAI client
+        backlog_item: The backlog item to analyze
+        initiatives: List of available initiatives
+        model_name: The model deployment name
+        additional_instructions: Optional additional instructions to include in the prompt
+        initiatives_text: Initiatives already rendered by format_initiatives_text. Callers
+            analyzing many backlog items against the same initiatives should format them
+            once and pass the result here; when omitted they are formatted on every call.
+
+    Returns:
+        EnrichedBacklogItem with AI analysis results
+
+    Raises:
+        RuntimeError: If the AI analysis fails
+    """
+    from models import BacklogAnalysisResult
+
+    try:
+        # Format initiatives for analysis unless the caller already did so
+        if initiatives_text is None:
+            initiatives_text = format_initiatives_text(initiatives)
+
+        # The instructions and initiatives are the same for every backlog
+        # item, so they form the system prompt; only the item itself varies
+        system_prompt = _build_backlog_analysis_system_prompt(initiatives_text, additional_instructions)
+        user_prompt = f"""BACKLOG ITEM:
+- Category: {backlog_item.category}
+- Title: {backlog_item.title}
+- Goal: {backlog_item.goal}
+- Stream: {backlog_item.stream}"""
+
         logger.info("Analyzing backlog item '%s' using model: %s with structured outputs", backlog_item.title, model_name)
 
         # Use structured outputs with Pydantic model
-        completion = client.beta.chat.completions.parse(
+        completion = _BACKLOG_ANALYSIS_TOKENS.parse(
+            client,
             model=model_name,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
             response_format=BacklogAnalysisResult,
-            temperature=0.1,
-            max_tokens=1500
+            temperature=0.1
         )
 
         # Extract the parsed result
@@ -1600,32 +2927,10 @@ Only suggest a primary_initiative if confidence is above 40. Use null if no good
 
         if analysis_result is None:
             logger.error("Failed to parse structured output for backlog item '%s'", backlog_item.title)
-            # Create a default analysis
-            analysis_result = BacklogAnalysisResult(
-                primary_initiative=None,
-                secondary_initiatives=[],
-                category_confidence=0,
-                initiative_confidence=0,
-                impact_analysis="Failed to analyze due to parsing error",
-                detailed_analysis="Structured output parsing failed",
-                resource_implications="Not analyzed due to error",
-                recommendations=[]
-            )
+            return _unparsed_enriched_item(backlog_item)
 
         # Create enriched backlog item
-        enriched_item = EnrichedBacklogItem(
-            original_item=backlog_item,
-            matched_initiative=analysis_result.primary_initiative,
-            secondary_initiatives=analysis_result.secondary_initiatives,
-            category_confidence=analysis_result.category_confidence,
-            initiative_confidence=analysis_result.initiative_confidence,
-            impact_analysis=analysis_result.impact_analysis,
-            detailed_analysis=analysis_result.detailed_analysis,
-            resource_implications=analysis_result.resource_implications,
-            recommendations=analysis_result.recommendations
-        )
-
-        return enriched_item
+        return _enriched_item_from_analysis(backlog_item, analysis_result)
 
     except Exception as e:
         logger.error("Failed to analyze backlog item '%s': %s", backlog_item.title, e)
@@ -0,0 +1,50 @@
+"""
+Pydantic models for the Initiative Analyzer structured outputs.
+
+These models are kept out of initiative_analyzer.py so that pydantic is only
+imported when an analysis actually calls the language model.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class BacklogAnalysisResult(BaseModel):
+    """Structured output model for backlog item analysis."""
+    primary_initiative: Optional[str]
+    secondary_initiatives: List[str]
+    category_confidence: int
+    initiative_confidence: int
+    impact_analysis: str
+    detailed_analysis: str
+    resource_implications: str
+    recommendations: List[str]
+
+
+class InitiativeRelevanceItem(BaseModel):
+    """Model for a single relevant backlog item in initiative analysis."""
+    backlog_item_title: str
+    relevance_score: int
+    impact_analysis: str
+    strategic_value: str
+    implementation_synergies: str
+    confidence_reasoning: str
+
+
+class InitiativeRelevanceResult(BaseModel):
+    """Structured output model for initiative relevance analysis."""
+    relevant_items: List[InitiativeRelevanceItem]
+
+
+class CondensedInitiative(BaseModel):
+    """Structured output model for a condensed initiative description."""
+    details: str
+    description: str
+    current_state: str
+    solutions: str
+
+
+class CondensedDescription(BaseModel):
+    """Structured output model for a condensed initiative description used in item-centric prompts."""
+    description: str
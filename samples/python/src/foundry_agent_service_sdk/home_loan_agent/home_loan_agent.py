@@ -8,17 +8,68 @@ and agent services.
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from azure.ai.agents.models import (
     CodeInterpreterTool,
     FilePurpose,
     FileSearchTool,
-    MessageAttachment,
+    ListSortOrder,
 )
 from azure.ai.projects import AIProjectClient
 from azure.identity import DefaultAzureCredential
 
+# python-dotenv is optional; without it only system environment variables are used
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+# Instructions for the home loan guide agent
+HOME_LOAN_INSTRUCTIONS = """Home Loan Guide is your expert assistant with over 10 years of experience in mortgage lending and loan processing. I am here to simplify the mortgage application process and support borrowers in making informed decisions about their home financing.
+
+My primary responsibilities include:
+
+1. Guiding users through the mortgage application process step-by-step.
+2. Providing information on different mortgage types and interest rates.
+3. Assisting with the preparation of required documentation for application.
+4. Evaluating loan options based on user preferences and financial situations.
+5. Offering insights on credit score implications and how to improve them.
+6. Answering questions regarding loan approvals and denials.
+7. Explaining mortgage terms and payment structures in simple language.
+8. Assisting clients in understanding the closing process and associated fees.
+
+I combine financial logic and document awareness to provide smart, supportive advice through every phase of the mortgage journey.
+
+# Form Details
+To effectively assist you, please provide answers to the following:
+
+What type of mortgage are you interested in? (e.g., conventional, FHA, VA)
+
+What is the purchase price of the property you are considering?
+
+What is your estimated down payment amount?
+
+Do you have a pre-approval letter or any existing mortgage offers?
+
+What is your current credit score range, if known?
+
+Are there specific concerns or questions you have about the mortgage process or options?
+
+# Manager Feedback
+To enhance my capabilities as a Mortgage Loan Assistant, I follow these feedback insights:
+
+Provide real-time updates on application statuses to keep users informed.
+
+Use clear, jargon-free language to simplify complex mortgage concepts.
+
+Be proactive in offering mortgage rate comparisons and product suggestions.
+
+Maintain a supportive and patient demeanor throughout the application process.
+
+Follow up after application submissions to assist with documentation or next steps."""
+
 
 # Parse command-line arguments
 def parse_arguments():
@@ -43,6 +94,11 @@ def parse_arguments():
         action="store_true",
         help="Run in interactive mode to ask multiple questions"
     )
+    parser.add_argument(
+        "--questions-file",
+        type=str,
+        help="Text file with one question per line to answer in turn using a single agent"
+    )
     return parser.parse_args()
 
 # Function to initialize and test the project client
@@ -57,11 +113,8 @@ def initialize_client():
         SystemExit: If connection fails or required environment variables are missing.
     """
     # Load environment variables from .env file if it exists
-    try:
-        from dotenv import load_dotenv
+    if load_dotenv is not None:
         load_dotenv()
-    except ImportError:
-        pass  # python-dotenv not available, use system environment variables
 
     # Create project client using connection string, copied from your Microsoft Foundry project
     credential = DefaultAzureCredential()
@@ -109,15 +162,19 @@ def create_agent(project_client):
     print(f"Uploading checklist file from: {checklist_file_path}")
     print(f"File exists: {checklist_file_path.exists()}")
 
-    # Upload the loan checklist file
-    checklist_file = project_client.agents.files.upload_and_poll(file_path=str(checklist_file_path), purpose=FilePurpose.AGENTS)
-    print(f"Uploaded file, file ID: {checklist_file.id}")
-
-    # Upload a file for use with Code Interpreter
-    code_interpreter_file = project_client.agents.files.upload_and_poll(
-        file_path=str(dataset_file_path), purpose=FilePurpose.AGENTS
-    )
-    print(f"Uploaded file, file ID: {code_interpreter_file.id}")
+    # Upload the loan checklist file and the file for use with Code Interpreter;
+    # the uploads are independent, so they run concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        checklist_future = executor.submit(
+            project_client.agents.files.upload_and_poll, file_path=str(checklist_file_path), purpose=FilePurpose.AGENTS
+        )
+        code_interpreter_future = executor.submit(
+            project_client.agents.files.upload_and_poll, file_path=str(dataset_file_path), purpose=FilePurpose.AGENTS
+        )
+        checklist_file = checklist_future.result()
+        print(f"Uploaded file, file ID: {checklist_file.id}")
+        code_interpreter_file = code_interpreter_future.result()
+        print(f"Uploaded file, file ID: {code_interpreter_file.id}")
 
     # create a vector store with the file you uploaded
     vector_store = project_client.agents.vector_stores.create_and_poll(file_ids=[checklist_file.id], name="my_vectorstore")
@@ -132,48 +189,7 @@ def create_agent(project_client):
     agent = project_client.agents.create_agent(
         model=model_deployment_name,
         name="home-loan-guide",
-        instructions="""Home Loan Guide is your expert assistant with over 10 years of experience in mortgage lending and loan processing. I am here to simplify the mortgage application process and support borrowers in making informed decisions about their home financing.
-
-My primary responsibilities include:
-
-1. Guiding users through the mortgage application process step-by-step.
-2. Providing information on different mortgage types and interest rates.
-3. Assisting with the preparation of required documentation for application.
-4. Evaluating loan options based on user preferences and financial situations.
-5. Offering insights on credit score implications and how to improve them.
-6. Answering questions regarding loan approvals and denials.
-7. Explaining mortgage terms and payment structures in simple language.
-8. Assisting clients in understanding the closing process and associated fees.
-
-I combine financial logic and document awareness to provide smart, supportive advice through every phase of the mortgage journey.
-
-# Form Details
-To effectively assist you, please provide answers to the following:
-
-What type of mortgage are you interested in? (e.g., conventional, FHA, VA)
-
-What is the purchase price of the property you are considering?
-
-What is your estimated down payment amount?
-
-Do you have a pre-approval letter or any existing mortgage offers?
-
-What is your current credit score range, if known?
-
-Are there specific concerns or questions you have about the mortgage process or options?
-
-# Manager Feedback
-To enhance my capabilities as a Mortgage Loan Assistant, I follow these feedback insights:
-
-Provide real-time updates on application statuses to keep users informed.
-
-Use clear, jargon-free language to simplify complex mortgage concepts.
-
-Be proactive in offering mortgage rate comparisons and product suggestions.
-
-Maintain a supportive and patient demeanor throughout the application process.
-
-Follow up after application submissions to assist with documentation or next steps.""",
+        instructions=HOME_LOAN_INSTRUCTIONS,
         tools=file_search_tool.definitions + code_interpreter.definitions,
         tool_resources=file_search_tool.resources,
     )
@@ -229,18 +245,22 @@ def cleanup_agent(project_client, agent, resources):
     """
     print("\nCleaning up resources...")
 
-    # Cleanup resources
-    project_client.agents.vector_stores.delete(resources['vector_store'].id)
-    print("Deleted vector store")
-
-    project_client.agents.files.delete(resources['checklist_file'].id)
-    print("Deleted checklist file")
-
-    project_client.agents.files.delete(resources['code_interpreter_file'].id)
-    print("Deleted code interpreter file")
-
-    project_client.agents.delete_agent(agent.id)
-    print("Deleted agent")
+    # The deletions are independent requests, so they are issued concurrently;
+    # each one is reported separately and a failure does not stop the others
+    deletions = [
+        ("vector store", project_client.agents.vector_stores.delete, resources['vector_store'].id),
+        ("checklist file", project_client.agents.files.delete, resources['checklist_file'].id),
+        ("code interpreter file", project_client.agents.files.delete, resources['code_interpreter_file'].id),
+        ("agent", project_client.agents.delete_agent, agent.id),
+    ]
+    with ThreadPoolExecutor(max_workers=len(deletions)) as executor:
+        futures = [executor.submit(delete, resource_id) for _, delete, resource_id in deletions]
+        for (name, _, resource_id), future in zip(deletions, futures):
+            try:
+                future.result()
+                print(f"Deleted {name}")
+            except Exception as e:
+                print(f"Warning: Could not delete {name} {resource_id}: {e}")
 
 # Function to ask a single question using a provided thread
 def ask_question(project_client, agent, question, thread):
@@ -253,23 +273,14 @@ def ask_question(project_client, agent, question, thread):
         question: The question string to ask.
         thread: The thread instance to use for the conversation.
     """
-    # Get absolute paths for the files
-    current_dir = Path(__file__).parent
-    checklist_file_path = current_dir / 'Contoso_Loan_Documentation_Checklist.md'
-
     print(f"Using thread, thread ID: {thread.id}")
 
-    # Upload the user provided file as a message attachment
-    message_file = project_client.agents.files.upload_and_poll(file_path=str(checklist_file_path), purpose=FilePurpose.AGENTS)
-    print(f"Uploaded file, file ID: {message_file.id}")
-
-    # Create a message with the file search attachment
-    # Notice that vector store is created temporarily when using attachments with a default expiration policy of seven days.
-    attachment = MessageAttachment(file_id=message_file.id, tools=FileSearchTool().definitions)
-
+    # The checklist is uploaded once in create_agent and is already searchable
+    # through the agent's vector store, so the question is sent without
+    # re-uploading it as a message attachment
     print(f"\nAsking question: {question}")
     message = project_client.agents.messages.create(
-        thread_id=thread.id, role="user", content=question, attachments=[attachment]
+        thread_id=thread.id, role="user", content=question
     )
     print(f"Created message, message ID: {message.id}")
 
@@ -279,13 +290,11 @@ def ask_question(project_client, agent, question, thread):
 
     # Get the conversation messages after the run is processed
     print("\n=== CONVERSATION MESSAGES ===")
-    messages = project_client.agents.messages.list(thread_id=thread.id)
+    # Request the messages oldest first so they are displayed in chronological
+    # order as each page arrives, without collecting and reversing the thread
+    messages = project_client.agents.messages.list(thread_id=thread.id, order=ListSortOrder.ASCENDING)
 
-    # Display messages in chronological order (reverse the list since they come newest first)
-    message_list = list(messages)
-    message_list.reverse()
-
-    for i, message in enumerate(message_list, 1):
+    for i, message in enumerate(messages, 1):
         role = message.role.upper()
         content = ""
         # Extract text content from the message
@@ -313,10 +322,6 @@ def ask_question(project_client, agent, question, thread):
 
     print("\n=== END CONVERSATION ===\n")
 
-    # Clean up only the message file for this question
-    project_client.agents.files.delete(message_file.id)
-    print("Deleted message file")
-
 # Function to process a single question with complete lifecycle management
 def process_question(project_client, question):
     """
@@ -342,6 +347,51 @@ def process_question(project_client, question):
             delete_thread(project_client, thread)
         cleanup_agent(project_client, agent, resources)
 
+# Function to process a batch of questions with one agent
+def process_questions(project_client, questions):
+    """
+    Process several questions with one agent, giving each question its own thread.
+
+    The agent and its uploaded files and vector store are created once and
+    cleaned up after the last question, rather than once per question.
+
+    Args:
+        project_client: Azure AI Project client instance.
+        questions: List of question strings to process.
+    """
+    # Create the agent once for all of the questions
+    agent, resources = create_agent(project_client)
+
+    try:
+        for question in questions:
+            thread = None
+            try:
+                # Each question gets a dedicated thread, as in single question mode
+                thread = create_thread(project_client)
+                ask_question(project_client, agent, question, thread)
+            except Exception as e:
+                print(f"Error processing question: {e}")
+            finally:
+                if thread:
+                    delete_thread(project_client, thread)
+    finally:
+        # Clean up the agent and resources after the last question
+        cleanup_agent(project_client, agent, resources)
+
+# Function to read questions from a file
+def load_questions(file_path):
+    """
+    Read questions from a text file, one question per line.
+
+    Args:
+        file_path: Path to the questions file.
+
+    Returns:
+        list: The non-blank lines of the file, stripped of surrounding whitespace.
+    """
+    with open(file_path, encoding="utf-8") as questions_file:
+        return [line.strip() for line in questions_file if line.strip()]
+
 # Interactive mode function
 def interactive_mode(project_client):
     """
@@ -390,7 +440,8 @@ def main():
     """
     Main entry point for the home loan agent application.
 
-    Parses command-line arguments and runs either interactive mode or processes a single question.
+    Parses command-line arguments and runs interactive mode, processes the questions
+    in a questions file, or processes a single question.
     """
     args = parse_arguments()
 
@@ -399,6 +450,8 @@ def main():
 
     if args.interactive:
         interactive_mode(project_client)
+    elif args.questions_file:
+        process_questions(project_client, load_questions(args.questions_file))
     else:
         process_question(project_client, args.question)
 
@@ -20,9 +20,22 @@ Key components:
 import argparse
 import json
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import uuid4
 
+# python-dotenv is optional; without it only system environment variables are used
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+# The approval flow handlers report a missing agent_framework when called
+try:
+    from agent_framework import ChatMessage
+except ImportError:
+    ChatMessage = None
+
 # ============================================================================
 # MCP Configuration - Same for all samples
 # ============================================================================
@@ -67,6 +80,89 @@ AZURE_ARCHITECT_NAME = "azure-architect-assistant"
 # Local Python Tools for Azure Architect
 # ============================================================================
 
+# Simplified pricing data (in production, use Azure Pricing API)
+_BASE_PRICES: Dict[str, Dict[str, float]] = {
+    "vm": {"Basic": 15.0, "Standard": 75.0, "Premium": 200.0},
+    "storage": {"Standard_LRS": 0.02, "Standard_GRS": 0.04, "Premium_LRS": 0.15},
+    "sql": {"Basic": 5.0, "Standard": 25.0, "Premium": 125.0},
+    "appservice": {"Free": 0.0, "Basic": 55.0, "Standard": 75.0, "Premium": 150.0},
+    "aks": {"Standard": 73.0, "Premium": 146.0},
+    "cosmosdb": {"Serverless": 0.25, "Provisioned": 25.0},
+    "redis": {"Basic": 16.0, "Standard": 50.0, "Premium": 225.0},
+    "keyvault": {"Standard": 3.0, "Premium": 5.0},
+}
+
+# Bicep templates for generate_bicep_snippet, formatted with the resource name
+# and location; literal Bicep braces are doubled for str.format
+_BICEP_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "storage": {
+        "avm": """module storage 'br/public:avm/res/storage/storage-account:0.14.0' = {{
+  name: 'storage-deployment'
+  params: {{
+    name: '{name}'
+    location: '{location}'
+    skuName: 'Standard_LRS'
+    kind: 'StorageV2'
+    allowBlobPublicAccess: false
+    networkAcls: {{
+      defaultAction: 'Deny'
+    }}
+  }}
+}}""",
+        "raw": """resource storageAccount 'Microsoft.Storage/storageAccounts@2023-01-01' = {{
+  name: '{name}'
+  location: '{location}'
+  sku: {{ name: 'Standard_LRS' }}
+  kind: 'StorageV2'
+  properties: {{
+    allowBlobPublicAccess: false
+  }}
+}}""",
+    },
+    "keyvault": {
+        "avm": """module keyVault 'br/public:avm/res/key-vault/vault:0.9.0' = {{
+  name: 'keyvault-deployment'
+  params: {{
+    name: '{name}'
+    location: '{location}'
+    enableRbacAuthorization: true
+    enableSoftDelete: true
+    softDeleteRetentionInDays: 90
+  }}
+}}""",
+        "raw": """resource keyVault 'Microsoft.KeyVault/vaults@2023-07-01' = {{
+  name: '{name}'
+  location: '{location}'
+  properties: {{
+    sku: {{ family: 'A', name: 'standard' }}
+    tenantId: tenant().tenantId
+    enableRbacAuthorization: true
+  }}
+}}""",
+    },
+    "vm": {
+        "avm": """module virtualMachine 'br/public:avm/res/compute/virtual-machine:0.5.0' = {{
+  name: 'vm-deployment'
+  params: {{
+    name: '{name}'
+    location: '{location}'
+    vmSize: 'Standard_D2s_v3'
+    osType: 'Linux'
+    zone: 1
+  }}
+}}""",
+        "raw": """resource vm 'Microsoft.Compute/virtualMachines@2024-03-01' = {{
+  name: '{name}'
+  location: '{location}'
+  properties: {{
+    hardwareProfile: {{ vmSize: 'Standard_D2s_v3' }}
+    // Additional configuration required
+  }}
+}}""",
+    },
+}
+
+
 def estimate_azure_costs(
     resource_type: str,
     sku: str = "Standard",
@@ -88,28 +184,16 @@ def estimate_azure_costs(
     Returns:
         Dictionary with cost estimate details.
     """
-    # Simplified pricing data (in production, use Azure Pricing API)
-    base_prices = {
-        "vm": {"Basic": 15.0, "Standard": 75.0, "Premium": 200.0},
-        "storage": {"Standard_LRS": 0.02, "Standard_GRS": 0.04, "Premium_LRS": 0.15},
-        "sql": {"Basic": 5.0, "Standard": 25.0, "Premium": 125.0},
-        "appservice": {"Free": 0.0, "Basic": 55.0, "Standard": 75.0, "Premium": 150.0},
-        "aks": {"Standard": 73.0, "Premium": 146.0},
-        "cosmosdb": {"Serverless": 0.25, "Provisioned": 25.0},
-        "redis": {"Basic": 16.0, "Standard": 50.0, "Premium": 225.0},
-        "keyvault": {"Standard": 3.0, "Premium": 5.0},
-    }
-
     resource_lower = resource_type.lower()
-    if resource_lower not in base_prices:
+    if resource_lower not in _BASE_PRICES:
         return {
             "resource_type": resource_type,
-            "error": f"Unknown resource type. Supported: {list(base_prices.keys())}",
+            "error": f"Unknown resource type. Supported: {list(_BASE_PRICES.keys())}",
             "estimated_monthly_cost_usd": None,
         }
 
-    sku_prices = base_prices[resource_lower]
-    sku_key = sku.split("_")[0] if "_" in sku else sku
+    sku_prices = _BASE_PRICES[resource_lower]
+    sku_key = sku.partition("_")[0]
 
     if sku_key not in sku_prices:
         sku_key = list(sku_prices.keys())[1]  # Default to middle tier
@@ -129,6 +213,46 @@ def estimate_azure_costs(
     }
 
 
+# Component checks for validate_architecture, in reporting order. Each entry is
+# (pillar, severity, finding, recommendation, score penalty, component names);
+# the finding is reported when none of the component names are present
+_WAF_COMPONENT_CHECKS = (
+    # Reliability checks
+    (
+        "Reliability", "Warning",
+        "No zone or region redundancy detected",
+        "Consider availability zones or multi-region deployment",
+        10, frozenset({"availability zone", "zone", "multi-region"}),
+    ),
+    (
+        "Reliability", "Warning",
+        "No backup or disaster recovery components",
+        "Add Azure Backup, Site Recovery, or geo-replication",
+        10, frozenset({"backup", "recovery", "geo-replication"}),
+    ),
+    # Security checks
+    (
+        "Security", "Critical",
+        "No secrets management detected",
+        "Use Azure Key Vault for secrets and Managed Identity for auth",
+        15, frozenset({"key vault", "keyvault", "managed identity"}),
+    ),
+    (
+        "Security", "Critical",
+        "No network security components",
+        "Add NSGs, Azure Firewall, or Private Endpoints",
+        15, frozenset({"nsg", "firewall", "private endpoint", "vnet"}),
+    ),
+    # Operational Excellence checks
+    (
+        "Operational Excellence", "Warning",
+        "No monitoring components",
+        "Add Azure Monitor, Log Analytics, and Application Insights",
+        10, frozenset({"monitor", "log analytics", "app insights"}),
+    ),
+)
+
+
 def validate_architecture(
     components: List[str],
     requirements: Optional[List[str]] = None
@@ -146,58 +270,22 @@ def validate_architecture(
     findings: List[Dict[str, str]] = []
     score = 100
 
-    components_lower = [c.lower() for c in components]
-
-    # Reliability checks
-    if not any(x in components_lower for x in ["availability zone", "zone", "multi-region"]):
-        findings.append({
-            "pillar": "Reliability",
-            "severity": "Warning",
-            "finding": "No zone or region redundancy detected",
-            "recommendation": "Consider availability zones or multi-region deployment",
-        })
-        score -= 10
-
-    if not any(x in components_lower for x in ["backup", "recovery", "geo-replication"]):
-        findings.append({
-            "pillar": "Reliability",
-            "severity": "Warning",
-            "finding": "No backup or disaster recovery components",
-            "recommendation": "Add Azure Backup, Site Recovery, or geo-replication",
-        })
-        score -= 10
-
-    # Security checks
-    if not any(x in components_lower for x in ["key vault", "keyvault", "managed identity"]):
-        findings.append({
-            "pillar": "Security",
-            "severity": "Critical",
-            "finding": "No secrets management detected",
-            "recommendation": "Use Azure Key Vault for secrets and Managed Identity for auth",
-        })
-        score -= 15
+    # The checks below look for exact component names, so a set gives each
+    # keyword a constant-time lookup instead of a scan of the component list
+    components_lower = {c.lower() for c in components}
 
-    if not any(x in components_lower for x in ["nsg", "firewall", "private endpoint", "vnet"]):
-        findings.append({
-            "pillar": "Security",
-            "severity": "Critical",
-            "finding": "No network security components",
-            "recommendation": "Add NSGs, Azure Firewall, or Private Endpoints",
-        })
-        score -= 15
-
-    # Operational Excellence checks
-    if not any(x in components_lower for x in ["monitor", "log analytics", "app insights"]):
-        findings.append({
-            "pillar": "Operational Excellence",
-            "severity": "Warning",
-            "finding": "No monitoring components",
-            "recommendation": "Add Azure Monitor, Log Analytics, and Application Insights",
-        })
-        score -= 10
+    for pillar, severity, finding, recommendation, penalty, keywords in _WAF_COMPONENT_CHECKS:
+        if components_lower.isdisjoint(keywords):
+            findings.append({
+                "pillar": pillar,
+                "severity": severity,
+                "finding": finding,
+                "recommendation": recommendation,
+            })
+            score -= penalty
 
     # Cost checks
-    if requirements and "cost" in str(requirements).lower():
+    if requirements and any("cost" in requirement.lower() for requirement in requirements):
         findings.append({
             "pillar": "Cost Optimization",
             "severity": "Info",
@@ -232,84 +320,17 @@ def generate_bicep_snippet(
     Returns:
         Dictionary with Bicep code and documentation links.
     """
-    snippets = {
-        "storage": {
-            "avm": f"""module storage 'br/public:avm/res/storage/storage-account:0.14.0' = {{
-  name: 'storage-deployment'
-  params: {{
-    name: '{name}'
-    location: '{location}'
-    skuName: 'Standard_LRS'
-    kind: 'StorageV2'
-    allowBlobPublicAccess: false
-    networkAcls: {{
-      defaultAction: 'Deny'
-    }}
-  }}
-}}""",
-            "raw": f"""resource storageAccount 'Microsoft.Storage/storageAccounts@2023-01-01' = {{
-  name: '{name}'
-  location: '{location}'
-  sku: {{ name: 'Standard_LRS' }}
-  kind: 'StorageV2'
-  properties: {{
-    allowBlobPublicAccess: false
-  }}
-}}""",
-        },
-        "keyvault": {
-            "avm": f"""module keyVault 'br/public:avm/res/key-vault/vault:0.9.0' = {{
-  name: 'keyvault-deployment'
-  params: {{
-    name: '{name}'
-    location: '{location}'
-    enableRbacAuthorization: true
-    enableSoftDelete: true
-    softDeleteRetentionInDays: 90
-  }}
-}}""",
-            "raw": f"""resource keyVault 'Microsoft.KeyVault/vaults@2023-07-01' = {{
-  name: '{name}'
-  location: '{location}'
-  properties: {{
-    sku: {{ family: 'A', name: 'standard' }}
-    tenantId: tenant().tenantId
-    enableRbacAuthorization: true
-  }}
-}}""",
-        },
-        "vm": {
-            "avm": f"""module virtualMachine 'br/public:avm/res/compute/virtual-machine:0.5.0' = {{
-  name: 'vm-deployment'
-  params: {{
-    name: '{name}'
-    location: '{location}'
-    vmSize: 'Standard_D2s_v3'
-    osType: 'Linux'
-    zone: 1
-  }}
-}}""",
-            "raw": f"""resource vm 'Microsoft.Compute/virtualMachines@2024-03-01' = {{
-  name: '{name}'
-  location: '{location}'
-  properties: {{
-    hardwareProfile: {{ vmSize: 'Standard_D2s_v3' }}
-    // Additional configuration required
-  }}
-}}""",
-        },
-    }
-
     resource_lower = resource_type.lower()
-    if resource_lower not in snippets:
+    if resource_lower not in _BICEP_TEMPLATES:
         return {
             "resource_type": resource_type,
-            "error": f"Unknown resource. Supported: {list(snippets.keys())}",
+            "error": f"Unknown resource. Supported: {list(_BICEP_TEMPLATES.keys())}",
             "bicep": None,
         }
 
-    snippet_set = snippets[resource_lower]
-    bicep_code = snippet_set["avm"] if use_avm else snippet_set["raw"]
+    # Only the selected template is formatted
+    template_set = _BICEP_TEMPLATES[resource_lower]
+    bicep_code = (template_set["avm"] if use_avm else template_set["raw"]).format(name=name, location=location)
 
     return {
         "resource_type": resource_type,
@@ -322,8 +343,16 @@ def generate_bicep_snippet(
     }
 
 
+# Parameter schema shared by the region argument of the cost estimate and the
+# location argument of the Bicep generator
+_REGION_SCHEMA = {
+    "type": "string",
+    "description": "Azure region",
+    "default": "eastus",
+}
+
 # Tool definitions for Agent Framework
-AZURE_ARCHITECT_TOOLS = [
+AZURE_ARCHITECT_TOOLS = (
     {
         "name": "estimate_azure_costs",
         "description": (
@@ -344,11 +373,7 @@ AZURE_ARCHITECT_TOOLS = [
                     "description": "SKU or tier",
                     "default": "Standard",
                 },
-                "region": {
-                    "type": "string",
-                    "description": "Azure region",
-                    "default": "eastus",
-                },
+                "region": _REGION_SCHEMA,
                 "quantity": {
                     "type": "integer",
                     "description": "Number of resources",
@@ -401,11 +426,7 @@ AZURE_ARCHITECT_TOOLS = [
                     "description": "Resource name",
                     "default": "myResource",
                 },
-                "location": {
-                    "type": "string",
-                    "description": "Azure region",
-                    "default": "eastus",
-                },
+                "location": _REGION_SCHEMA,
                 "use_avm": {
                     "type": "boolean",
                     "description": "Use Azure Verified Modules",
@@ -415,21 +436,46 @@ AZURE_ARCHITECT_TOOLS = [
             "required": ["resource_type"],
         },
     },
-]
+)
 
 
 # ============================================================================
 # Environment and Configuration
 # ============================================================================
 
+# Set once load_environment has run, so the sample entry points that each call
+# it only read the .env file the first time
+_environment_loaded = False
+
+
 def load_environment() -> None:
     """Load environment variables from .env file if available."""
-    # pylint: disable=import-outside-toplevel
-    try:
-        from dotenv import load_dotenv
+    global _environment_loaded  # pylint: disable=global-statement
+    if _environment_loaded:
+        return
+    if load_dotenv is not None:
         load_dotenv()
-    except ImportError:
-        pass  # python-dotenv not installed, use system env vars
+        # Settings read before the .env file was loaded may be stale
+        reset_env_cache()
+    _environment_loaded = True
+
+
+def reset_env_cache() -> None:
+    """
+    Forget the cached environment settings.
+
+    The get_* settings functions read their environment variables once and
+    cache the result; call this after changing the environment so the next
+    call reads it again.
+    """
+    for getter in (
+        get_project_endpoint,
+        get_application_endpoint,
+        get_cosmos_connection_string,
+        get_redis_url,
+        get_model_deployment_name,
+    ):
+        getter.cache_clear()
 
 
 def create_argument_parser(
@@ -474,26 +520,31 @@ def create_argument_parser(
     return parser
 
 
+@lru_cache(maxsize=1)
 def get_project_endpoint() -> Optional[str]:
     """Get the project endpoint from environment variables."""
     return os.environ.get("PROJECT_ENDPOINT")
 
 
+@lru_cache(maxsize=1)
 def get_application_endpoint() -> Optional[str]:
     """Get the application endpoint from environment variables."""
     return os.environ.get("AZURE_AI_APPLICATION_ENDPOINT")
 
 
+@lru_cache(maxsize=1)
 def get_cosmos_connection_string() -> Optional[str]:
     """Get the Cosmos DB connection string from environment variables."""
     return os.environ.get("COSMOS_DB_CONNECTION_STRING")
 
 
+@lru_cache(maxsize=1)
 def get_redis_url() -> Optional[str]:
     """Get the Redis URL from environment variables."""
     return os.environ.get("REDIS_URL")
 
 
+@lru_cache(maxsize=1)
 def get_model_deployment_name() -> str:
     """Get the model deployment name from environment variables.
 
@@ -522,6 +573,8 @@ class ClientSideThread:
     with persistence (Redis, Cosmos DB, etc.) for production use.
     """
 
+    __slots__ = ("id", "messages")
+
     def __init__(self, thread_id: Optional[str] = None):
         """Initialize a client-side thread."""
         self.id = thread_id or str(uuid4())
@@ -532,16 +585,26 @@ class ClientSideThread:
         self.messages.append({"role": role, "content": content})
 
     def get_messages(self) -> List[Dict[str, str]]:
-        """Get all messages in the thread."""
+        """Get a copy of all messages in the thread."""
         return self.messages.copy()
 
+    def get_messages_view(self) -> Sequence[Dict[str, str]]:
+        """
+        Get the messages in the thread without copying them.
+
+        The returned sequence is the thread's own history, so it must not be
+        modified and reflects later changes to the thread. Use get_messages
+        for an independent copy.
+        """
+        return self.messages
+
     def clear(self) -> None:
         """Clear all messages."""
         self.messages.clear()
 
     def to_json(self) -> str:
-        """Serialize thread to JSON for persistence."""
-        return json.dumps({"id": self.id, "messages": self.messages})
+        """Serialize thread to compact JSON for persistence."""
+        return json.dumps({"id": self.id, "messages": self.messages}, separators=(",", ":"))
 
     @classmethod
     def from_json(cls, json_str: str) -> "ClientSideThread":
@@ -594,6 +657,7 @@ __all__ = [
     "generate_bicep_snippet",
     # Utilities
     "load_environment",
+    "reset_env_cache",
     "get_project_endpoint",
     "get_application_endpoint",
     "get_cosmos_connection_string",
@@ -612,6 +676,39 @@ __all__ = [
 # MCP Approval Flow Handling
 # ============================================================================
 
+def _prompt_for_approvals(requests: Sequence[Any]) -> List[bool]:
+    """
+    Show every pending approval request and read the decisions with one prompt.
+
+    A single request is answered with y/n as before. For several requests the
+    user can answer y or n for all of them, or give one y/n per request
+    separated by commas; requests without a y answer are denied.
+
+    Args:
+        requests: The user input requests returned by the agent.
+
+    Returns:
+        One approval decision per request, in order.
+    """
+    for number, request in enumerate(requests, 1):
+        label = f"[APPROVAL REQUEST {number}/{len(requests)}]" if len(requests) > 1 else "[APPROVAL REQUEST]"
+        func_call = request.function_call
+        if func_call is not None:
+            print(f"\n{label} Tool: {func_call.name}")
+            print(f"  Arguments: {func_call.arguments}")
+        else:
+            print(f"\n{label} (unknown tool)")
+
+    if len(requests) == 1:
+        return [input("  Approve? (y/n): ").lower() == "y"]
+
+    answer = input("  Approve? (y/n for all, or one y/n per request separated by commas): ").strip().lower()
+    if "," not in answer:
+        return [answer == "y"] * len(requests)
+    decisions = [part.strip() == "y" for part in answer.split(",")]
+    return (decisions + [False] * len(requests))[:len(requests)]
+
+
 async def handle_approval_flow_with_thread(
     query: str,
     agent: Any,
@@ -628,32 +725,17 @@ async def handle_approval_flow_with_thread(
     Returns:
         The final AgentResponse after all approvals are handled.
     """
-    # pylint: disable=import-outside-toplevel
-    try:
-        from agent_framework import ChatMessage
-    except ImportError:
+    if ChatMessage is None:
         print("Error: agent_framework not installed")
         return None
 
     result = await agent.run(query, thread=thread)
     while len(result.user_input_requests) > 0:
-        new_input: List[Any] = []
-        for request in result.user_input_requests:
-            func_call = request.function_call
-            if func_call is not None:
-                print(f"\n[APPROVAL REQUEST] Tool: {func_call.name}")
-                print(f"  Arguments: {func_call.arguments}")
-            else:
-                print("\n[APPROVAL REQUEST] (unknown tool)")
-            approval = input("  Approve? (y/n): ")
-            new_input.append(
-                ChatMessage(
-                    role="user",
-                    contents=[request.to_function_approval_response(
-                        approval.lower() == "y"
-                    )]
-                )
-            )
+        requests = result.user_input_requests
+        new_input: List[Any] = [
+            ChatMessage(role="user", contents=[request.to_function_approval_response(approved)])
+            for request, approved in zip(requests, _prompt_for_approvals(requests))
+        ]
         result = await agent.run(new_input, thread=thread)
     return result
 
@@ -674,44 +756,29 @@ async def handle_approval_flow_stateless(
     Returns:
         The final AgentResponse after all approvals are handled.
     """
-    # pylint: disable=import-outside-toplevel
-    try:
-        from agent_framework import ChatMessage
-    except ImportError:
+    if ChatMessage is None:
         print("Error: agent_framework not installed")
         return None
 
     # Build input with conversation history
     messages: List[Any] = []
-    for msg in thread.get_messages():
+    for msg in thread.get_messages_view():
         messages.append({"role": msg["role"], "content": msg["content"]})
     messages.append({"role": "user", "content": query})
 
     result = await agent.run(messages, store=False)  # type: ignore[arg-type]
     thread.add_message("user", query)
 
+    # Nothing is stored server-side, so each approval round is appended to
+    # the same input list and the agent sees every earlier round as well
     while len(result.user_input_requests) > 0:
-        new_input: List[Any] = list(messages)
-        for request in result.user_input_requests:
-            func_call = request.function_call
-            if func_call is not None:
-                print(f"\n[APPROVAL REQUEST] Tool: {func_call.name}")
-                print(f"  Arguments: {func_call.arguments}")
-            else:
-                print("\n[APPROVAL REQUEST] (unknown tool)")
-            approval = input("  Approve? (y/n): ")
-            new_input.append(
-                ChatMessage(role="assistant", contents=[request])
-            )
-            new_input.append(
-                ChatMessage(
-                    role="user",
-                    contents=[request.to_function_approval_response(
-                        approval.lower() == "y"
-                    )]
-                )
+        requests = result.user_input_requests
+        for request, approved in zip(requests, _prompt_for_approvals(requests)):
+            messages.append(ChatMessage(role="assistant", contents=[request]))
+            messages.append(
+                ChatMessage(role="user", contents=[request.to_function_approval_response(approved)])
             )
-        result = await agent.run(new_input, store=False)
+        result = await agent.run(messages, store=False)
 
     thread.add_message("assistant", str(result))
     return result
@@ -275,7 +275,7 @@ async def run_with_hosted_mcp() -> None:
                     # Format: array of message objects with type, role, content
                     inputs: list[dict[str, Any]] = [
                         {"type": "message", "role": msg["role"], "content": msg["content"]}
-                        for msg in thread.get_messages()
+                        for msg in thread.get_messages_view()
                     ]
                     inputs.append({"type": "message", "role": "user", "content": question})
 
@@ -429,7 +429,7 @@ async def run_with_local_mcp() -> None:
 
                     inputs: list[dict[str, Any]] = [
                         {"type": "message", "role": msg["role"], "content": msg["content"]}
-                        for msg in thread.get_messages()
+                        for msg in thread.get_messages_view()
                     ]
                     inputs.append({"type": "message", "role": "user", "content": question})
 